@@ -10,7 +10,13 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "djangorestframework_versioning.settings")
 
 application = get_asgi_application()
+
+from drf_versioning.registry import freeze  # noqa: E402 (needs the apps to be loaded)
+
+get_resolver().url_patterns  # imports the URLconf, and so every view
+freeze()
@@ -10,7 +10,13 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "djangorestframework_versioning.settings")
 
 application = get_wsgi_application()
+
+from drf_versioning.registry import freeze  # noqa: E402 (needs the apps to be loaded)
+
+get_resolver().url_patterns  # imports the URLconf, and so every view
+freeze()
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.core.checks import Tags, register
 
 
 class DrfVersioningConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "drf_versioning"
+
+    def ready(self):
+        from .registry import check_registered_versions
+
+        # tagged "urls" because it imports the URLconf to find the views
+        register(check_registered_versions, Tags.urls)
@@ -0,0 +1,69 @@
+"""
+Helpers for caching versioned responses. Cache keys include a generation number per model, which
+is bumped whenever an instance of the model is saved or deleted, so that everything cached for
+the model is invalidated at once without having to track the keys.
+"""
+
+import hashlib
+import logging
+import time
+
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+
+KEY_PREFIX = "drf_versioning"
+
+logger = logging.getLogger(__name__)
+
+
+def get_generation_key(model) -> str:
+    return f"{KEY_PREFIX}:generation:{model._meta.label_lower}"
+
+
+def get_generation(model, alias: str = "default") -> int:
+    """The current generation of the model's data in the cache."""
+    cache = caches[alias]
+    key = get_generation_key(model)
+    generation = cache.get(key)
+    if generation is None:
+        generation = start_generation(cache, key)
+    return generation
+
+
+def start_generation(cache, key) -> int:
+    # Start from the time rather than 1, so that if the generation gets evicted from the cache,
+    # the new one won't match any responses that are still cached from before. Use add in case
+    # another process has just started one.
+    cache.add(key, time.time_ns(), timeout=None)
+    return cache.get(key)
+
+
+def invalidate(model, alias: str = "default"):
+    """Invalidate everything cached for the model, by starting a new generation."""
+    cache = caches[alias]
+    key = get_generation_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:  # not set yet
+        start_generation(cache, key)
+
+
+def connect_invalidation(model, alias: str = "default"):
+    """Invalidate the model's cached data whenever an instance of it is saved or deleted."""
+
+    def receiver(sender, **kwargs):
+        # A cache outage (or a misconfigured alias) mustn't stop the model from being saved.
+        try:
+            invalidate(model, alias)
+        except Exception:
+            logger.exception("Could not invalidate the cached data of %s", model._meta.label)
+
+    dispatch_uid = f"{KEY_PREFIX}:{alias}:{model._meta.label_lower}"
+    post_save.connect(receiver, sender=model, weak=False, dispatch_uid=dispatch_uid)
+    post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=dispatch_uid)
+
+
+def make_key(*parts) -> str:
+    """A cache key for the parts, safe to use with any cache backend."""
+    digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return f"{KEY_PREFIX}:{digest}"
@@ -2,7 +2,7 @@ from functools import wraps
 
 from django.http import Http404
 
-from drf_versioning.decorators.utils import get_min_version, get_max_version
+from drf_versioning.decorators.utils import get_version_window
 from drf_versioning.exceptions import VersionsNotDeclaredError
 from drf_versioning.settings import versioning_settings
 
@@ -14,37 +14,49 @@ def versioned_view(original_obj=None, introduced_in: Version = None, removed_in:
         if introduced_in is None and removed_in is None:
             raise VersionsNotDeclaredError(obj)
 
+        # if it's a bound method which we decorated dynamically:
+        # handler = versioned_view(handler, ...)
+        # otherwise it's an unbound function we decorated statically at class definition:
+        # @versioned_view(...)
+        # def list(...):
+        #     ...
+        is_bound_method = hasattr(obj, "__self__")
+
+        # The [min_version, max_version) window for each viewset class this view is used on.
+        # VersionedViewSetMeta fills this in when the viewset class is created; other viewsets
+        # get theirs computed on their first request.
+        version_windows = {}
+
         @wraps(obj)
         def func_wrapper(*args, **kwargs):
-            # if it's a bound method which we decorated dynamically:
-            # handler = versioned_view(handler, ...)
-            if hasattr(obj, "__self__"):
+            if is_bound_method:
                 request = args[0]
-                viewset = obj.__self__
-
-            # if it's an unbound function we decorated statically at class definition:
-            # @versioned_view(...)
-            # def list(...):
-            #     ...
+                viewset_class = obj.__self__.__class__
             else:
-                viewset, request = args
-
-            viewset_introduced_in = getattr(viewset, "introduced_in", None)
-            viewset_removed_in = getattr(viewset, "removed_in", None)
-            min_version = get_min_version(introduced_in, viewset_introduced_in)
-            max_version = get_max_version(removed_in, viewset_removed_in)
-            if min_version and request.version < min_version:
+                viewset, request = args[:2]
+                viewset_class = viewset.__class__
+
+            try:
+                min_version, max_version = version_windows[viewset_class]
+            except KeyError:
+                min_version, max_version = version_windows[viewset_class] = get_version_window(
+                    func_wrapper, viewset_class
+                )
+            if min_version is not None and request.version < min_version:
                 raise Http404()
-            if max_version and request.version >= max_version:
+            if max_version is not None and request.version >= max_version:
                 raise Http404()
-            output = obj(*args, **kwargs)
-            return output
+            return obj(*args, **kwargs)
+
+        func_wrapper.introduced_in = introduced_in
+        func_wrapper.removed_in = removed_in
+        func_wrapper.version_windows = version_windows
 
         if introduced_in:
-            introduced_in.view_methods_introduced.append(func_wrapper)
+            introduced_in.register("view_methods_introduced", func_wrapper)
 
         if removed_in:
-            removed_in.view_methods_removed.append(func_wrapper)
+            removed_in.register("view_methods_removed", func_wrapper)
 
         return func_wrapper
 
@@ -6,14 +6,30 @@ Version = versioning_settings.VERSION_MODEL
 
 
 def get_min_version(view_min: Optional[Version], viewset_min: Optional[Version]):
-    if view_min is viewset_min is None:
-        return None
-    default = Version.get_earliest()
-    return max(default, view_min or default, viewset_min or default)
+    """The view is available from the later of the two introduced_in versions."""
+    if view_min is None:
+        return viewset_min
+    if viewset_min is None:
+        return view_min
+    return max(view_min, viewset_min)
 
 
 def get_max_version(view_max: Optional[Version], viewset_max: Optional[Version]):
-    if view_max is viewset_max is None:
-        return None
-    default = Version.get_latest()
-    return min(default, view_max or default, viewset_max or default)
+    """The view is available until the earlier of the two removed_in versions."""
+    if view_max is None:
+        return viewset_max
+    if viewset_max is None:
+        return view_max
+    return min(view_max, viewset_max)
+
+
+def get_version_window(view, viewset) -> tuple[Optional[Version], Optional[Version]]:
+    """
+    Combine the introduced_in / removed_in versions of a view decorated with versioned_view, and
+    those of the viewset it is used on, into the [min_version, max_version) window in which the
+    view is available.
+    """
+    return (
+        get_min_version(view.introduced_in, getattr(viewset, "introduced_in", None)),
+        get_max_version(view.removed_in, getattr(viewset, "removed_in", None)),
+    )
@@ -1,3 +1,4 @@
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework import status
 from rest_framework.exceptions import APIException
 
@@ -18,3 +19,9 @@ class VersionsNotDeclaredError(ValueError):
     def __init__(self, obj_name: str) -> None:
         msg = f"You need to declare either introduced_in or removed_in for {obj_name}"
         super().__init__(msg)
+
+
+class VersionNotInVersionListError(ImproperlyConfigured):
+    def __init__(self, obj_name: str, version) -> None:
+        msg = f"{obj_name} uses version {version}, which is not in the VERSION_LIST"
+        super().__init__(msg)
@@ -0,0 +1,121 @@
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+from packaging.version import InvalidVersion
+from rest_framework.utils import encoders
+
+from drf_versioning.exceptions import VersionDoesNotExist
+from drf_versioning.serializers import VersionedSerializer
+from drf_versioning.serializers.fan_out import RequestAtVersion
+from drf_versioning.settings import versioning_settings
+
+Version = versioning_settings.VERSION_MODEL
+
+
+def convert_lines(serializer_path: str, version_str: str, upgrade: bool, lines: list[str]) -> str:
+    """
+    Convert a batch of JSONL lines with the transforms of the serializer at serializer_path.
+    Downgrades from the latest version to version_str, or upgrades from version_str to the latest
+    version. Runs in the worker processes, so it takes and returns plain strings.
+    """
+    serializer_class = import_string(serializer_path)
+    version = Version.get(version_str)
+    plan = serializer_class().get_transform_plan(version)
+    request = RequestAtVersion(None, version)
+    output = []
+    for line in lines:
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        if upgrade:
+            plan.to_internal_value(data, request)
+        else:
+            plan.to_representation(data, request, None)
+        output.append(json.dumps(data, cls=encoders.JSONEncoder, separators=(",", ":")) + "\n")
+    return "".join(output)
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert JSONL payloads between versions with a VersionedSerializer's transforms: "
+        "downgrade payloads from the latest version with --to-version, or upgrade them to the "
+        "latest version with --from-version."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("serializer", help="Dotted path to a VersionedSerializer subclass")
+        parser.add_argument("input", nargs="?", default="-", help="JSONL file, or - for stdin")
+        parser.add_argument("-o", "--output", default="-", help="JSONL file, or - for stdout")
+        direction = parser.add_mutually_exclusive_group(required=True)
+        direction.add_argument("--to-version", help="Downgrade from the latest version")
+        direction.add_argument("--from-version", help="Upgrade to the latest version")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of worker processes (default: one per CPU). 0 converts in this process.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Lines sent to a worker at a time"
+        )
+
+    def handle(self, *args, **options):
+        serializer_path = options["serializer"]
+        try:
+            serializer_class = import_string(serializer_path)
+        except ImportError as e:
+            raise CommandError(e)
+        if not isinstance(serializer_class, type) or not issubclass(
+            serializer_class, VersionedSerializer
+        ):
+            raise CommandError(f"{serializer_path} is not a VersionedSerializer")
+
+        upgrade = options["from_version"] is not None
+        version_str = options["from_version"] if upgrade else options["to_version"]
+        try:
+            Version.get(version_str)  # fail early, rather than in every worker
+        except (InvalidVersion, VersionDoesNotExist) as e:
+            raise CommandError(e)
+
+        infile = sys.stdin if options["input"] == "-" else open(options["input"])
+        if options["output"] == "-":
+            outfile, write = None, partial(self.stdout.write, ending="")
+        else:
+            outfile = open(options["output"], "w")
+            write = outfile.write
+        try:
+            batches = iter(lambda: list(islice(infile, options["batch_size"])), [])
+            args = (serializer_path, version_str, upgrade)
+            if options["workers"] == 0:
+                for batch in batches:
+                    write(convert_lines(*args, batch))
+            else:
+                workers = options["workers"] or os.cpu_count()
+                self.convert_in_parallel(args, batches, write, workers)
+        finally:
+            if infile is not sys.stdin:
+                infile.close()
+            if outfile is not None:
+                outfile.close()
+
+    @staticmethod
+    def convert_in_parallel(args, batches, write, workers):
+        """Convert the batches in worker processes, writing the results in the input order. Only
+        a few batches per worker are in flight at once, so memory stays bounded however big the
+        input is."""
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+            pending = deque()
+            for batch in batches:
+                pending.append(executor.submit(convert_lines, *args, batch))
+                if len(pending) >= workers * 2:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
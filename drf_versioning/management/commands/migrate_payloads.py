@@ -0,0 +1,78 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+from packaging.version import InvalidVersion
+
+from drf_versioning.exceptions import VersionDoesNotExist
+from drf_versioning.serializers import VersionedSerializer
+from drf_versioning.serializers.fan_out import RequestAtVersion
+from drf_versioning.settings import versioning_settings
+
+Version = versioning_settings.VERSION_MODEL
+
+
+class Command(BaseCommand):
+    help = (
+        "Upgrade payloads stored in a JSONField to the latest version with a VersionedSerializer's "
+        "transforms, in batches. Each row's version is read from, and then updated in, another "
+        "field. Rows which are already at the latest version are skipped, so the command can "
+        "safely be run again after an interruption; --after resumes from a primary key."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="The model, as app_label.ModelName")
+        parser.add_argument("serializer", help="Dotted path to a VersionedSerializer subclass")
+        parser.add_argument("--data-field", default="data", help="The JSONField with the payload")
+        parser.add_argument(
+            "--version-field", default="version", help="The field with the payload's version"
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--after", help="Only migrate rows with a primary key after this one")
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+            serializer_class = import_string(options["serializer"])
+        except (LookupError, ValueError, ImportError) as e:
+            raise CommandError(e)
+        if not isinstance(serializer_class, type) or not issubclass(
+            serializer_class, VersionedSerializer
+        ):
+            raise CommandError(f"{options['serializer']} is not a VersionedSerializer")
+
+        data_field, version_field = options["data_field"], options["version_field"]
+        latest = str(Version.get_latest())
+        queryset = (
+            model._default_manager.exclude(**{version_field: latest})
+            .only("pk", data_field, version_field)
+            .order_by("pk")
+        )
+        serializer = serializer_class()
+        last_pk = options["after"]
+        n_migrated = n_skipped = 0
+        while True:
+            batch = queryset.filter(pk__gt=last_pk) if last_pk is not None else queryset
+            batch = list(batch[: options["batch_size"]])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            updated = []
+            for obj in batch:
+                try:
+                    version = Version.get(getattr(obj, version_field))
+                except (InvalidVersion, VersionDoesNotExist):
+                    n_skipped += 1
+                    continue
+                plan = serializer.get_transform_plan(version)
+                plan.to_internal_value(getattr(obj, data_field), RequestAtVersion(None, version))
+                setattr(obj, version_field, latest)
+                updated.append(obj)
+            model._default_manager.bulk_update(updated, [data_field, version_field])
+
+            n_migrated += len(updated)
+            self.stdout.write(f"Migrated {n_migrated} rows, up to pk {last_pk}")
+
+        if n_skipped:
+            self.stderr.write(f"Skipped {n_skipped} rows with unknown versions")
+        self.stdout.write(self.style.SUCCESS(f"Migrated {n_migrated} rows to version {latest}"))
@@ -1,38 +1,101 @@
+from functools import lru_cache
+from typing import Optional
+
 from rest_framework import versioning
+from rest_framework.utils.urls import replace_query_param
 
-from drf_versioning.settings import versioning_settings
+from drf_versioning.settings import versioning_settings, versioning_settings_changed
 
 Version = versioning_settings.VERSION_MODEL
 
 
+@lru_cache(maxsize=256)
+def resolve_version(version_str: Optional[str]) -> Version:
+    """
+    Resolve the raw version string from a request to the canonical Version instance in the
+    VERSION_LIST. Clients tend to send the same few versions, so the results are memoized.
+    """
+    if not version_str:
+        return Version.get_default()
+    return Version.get(version_str)
+
+
+def clear_resolved_versions(*args, **kwargs):
+    resolve_version.cache_clear()
+
+
+versioning_settings_changed.connect(clear_resolved_versions)
+
+
+def is_latest_version(request) -> bool:
+    """
+    Whether the request is for the latest version, in which case there is nothing to transform.
+    The versioning classes below work this out once per request; for other requests it's worked
+    out on each call.
+    """
+    try:
+        return request.is_latest_version
+    except AttributeError:
+        return getattr(request, "version", None) is Version.get_latest()
+
+
 class GetDefaultMixin(versioning.BaseVersioning):
     """
     If no version is passed with the request -> return default version
     If unknown version is passed in the request -> raise VersionDoesNotExist
+
+    request.version is set to the canonical Version instance from the VERSION_LIST, so that later
+    comparisons don't need to parse it again, and request.is_latest_version is set for
+    is_latest_version. The version string as it was sent is kept as request.raw_version (None if
+    no version was sent).
     """
 
+    # the request headers which the version is read from, for the Vary header of the response
+    vary_headers: tuple[str, ...] = ()
+
     def determine_version(self, request, *args, **kwargs):
-        version = super().determine_version(request, *args, **kwargs)
-        if not version:
-            return Version.get_default().base_version
+        raw_version = super().determine_version(request, *args, **kwargs)
+        version = resolve_version(raw_version)
+        request.raw_version = raw_version or None
+        request.is_latest_version = version is Version.get_latest()
         return version
 
+    @staticmethod
+    def get_version_string(request) -> str:
+        """The version as the client sent it (e.g. "v1" or "1.0"), for building URLs which the
+        URLconf will match, or else the canonical version."""
+        return getattr(request, "raw_version", None) or str(request.version)
+
 
 class AcceptHeaderVersioning(GetDefaultMixin, versioning.AcceptHeaderVersioning):
-    pass
+    vary_headers = ("Accept",)
 
 
 class NamespaceVersioning(GetDefaultMixin, versioning.NamespaceVersioning):
-    pass
+    def get_versioned_viewname(self, viewname, request):
+        return f"{self.get_version_string(request)}:{viewname}"
 
 
 class URLPathVersioning(GetDefaultMixin, versioning.URLPathVersioning):
-    pass
+    def reverse(self, viewname, args=None, kwargs=None, request=None, format=None, **extra):
+        # as URLPathVersioning.reverse, but with the version as it appears in the URL
+        if request.version is not None:
+            kwargs = {**(kwargs or {}), self.version_param: self.get_version_string(request)}
+        return versioning.BaseVersioning.reverse(
+            self, viewname, args, kwargs, request, format, **extra
+        )
 
 
 class HostNameVersioning(GetDefaultMixin, versioning.HostNameVersioning):
-    pass
+    vary_headers = ("Host",)
 
 
 class QueryParameterVersioning(GetDefaultMixin, versioning.QueryParameterVersioning):
-    pass
+    def reverse(self, viewname, args=None, kwargs=None, request=None, format=None, **extra):
+        # as QueryParameterVersioning.reverse, but with the version as it was sent
+        url = versioning.BaseVersioning.reverse(
+            self, viewname, args, kwargs, request, format, **extra
+        )
+        if request.version is not None:
+            return replace_query_param(url, self.version_param, self.get_version_string(request))
+        return url
@@ -0,0 +1,153 @@
+"""
+Transforms, viewsets and versioned views register themselves with their Versions as they are
+defined. Once they all have been, projects can call freeze() to check and index the
+registrations, so that misconfiguration fails at boot, and the first requests don't need to build
+anything. E.g. in wsgi.py:
+
+    application = get_wsgi_application()
+    get_resolver().url_patterns  # imports the URLconf, and so every view
+    freeze()
+
+Without it, everything is built on first use. The versions are checked regardless, by the system
+check which DrfVersioningConfig.ready registers.
+"""
+
+from django.conf import settings
+from django.core.checks import Error
+from django.db.models import QuerySet
+from django.urls import get_resolver
+
+from .decorators.utils import get_version_window
+from .exceptions import VersionNotInVersionListError
+from .middleware import resolve_version
+from .serializers import VersionedSerializer
+from .serializers.queryset_plan import get_queryset_plan
+from .settings import versioning_settings
+from .transforms import Transform
+from .versions.changelog import get_changelog
+from .views import VersionedViewSet
+from .views.versioned_viewset import VersionedViewSetMeta
+
+Version = versioning_settings.VERSION_MODEL
+
+ERROR_ID = "drf_versioning.E001"
+
+REGISTRATION_ATTRIBUTES = (
+    "notes",
+    "transforms",
+    "viewsets_introduced",
+    "viewsets_removed",
+    "view_methods_introduced",
+    "view_methods_removed",
+)
+
+
+def freeze() -> None:
+    """
+    - check that every registered version is in the VERSION_LIST, and replace it with the
+      canonical Version instance from the list (moving its registrations there too)
+    - turn the registration lists of each Version into tuples
+    - build the transform plans, field maps and queryset plans of the viewsets' serializers, the
+      resolved versions and the changelog, for every version
+    """
+    registry = Version.registry()
+    strays = [version for version in registry.source if version is not registry.versions[version]]
+
+    def get_canonical(version, obj_name):
+        try:
+            canonical = registry.versions[version]
+        except KeyError:
+            raise VersionNotInVersionListError(obj_name, version)
+        if version is not canonical:
+            strays.append(version)
+        return canonical
+
+    for obj, attribute, version in get_registered_versions():
+        setattr(obj, attribute, get_canonical(version, obj.__qualname__))
+    viewsets = get_subclasses(VersionedViewSet)
+    for viewset in viewsets:
+        viewset.version_window = (viewset.introduced_in, viewset.removed_in)
+        for name, view in VersionedViewSetMeta.get_versioned_views(viewset).items():
+            window = view.version_windows[viewset] = get_version_window(view, viewset)
+            viewset.version_windows[name] = window
+
+    for stray in strays:
+        merge_registrations(stray, registry.versions[stray])
+    for version in registry.ordered:
+        for attribute in REGISTRATION_ATTRIBUTES:
+            setattr(version, attribute, tuple(getattr(version, attribute)))
+    for stray in strays:
+        for attribute in REGISTRATION_ATTRIBUTES:
+            setattr(stray, attribute, getattr(registry.versions[stray], attribute))
+
+    # Only the serializers which the viewsets use are prepared, because others (e.g. abstract
+    # base classes) can't necessarily be instantiated.
+    prepared = set()
+    for viewset in viewsets:
+        serializer_class = getattr(viewset, "serializer_class", None)
+        if not is_versioned_serializer(serializer_class):
+            continue
+        if serializer_class not in prepared:
+            serializer_class.prepare(registry.ordered)
+            prepared.add(serializer_class)
+        if isinstance(viewset.queryset, QuerySet):
+            for version in registry.ordered:
+                get_queryset_plan(serializer_class, version, viewset.queryset.model)
+    resolve_version(None)
+    for version in registry.ordered:
+        resolve_version(str(version))
+    get_changelog()
+
+
+def get_registered_versions() -> list[tuple[object, str, "Version"]]:
+    """(obj, attribute, version) for every version declared by a transform, viewset or versioned
+    view."""
+    registered = []
+    for transform in get_subclasses(Transform):
+        if version := getattr(transform, "version", None):
+            registered.append((transform, "version", version))
+    for viewset in get_subclasses(VersionedViewSet):
+        views = VersionedViewSetMeta.get_versioned_views(viewset).values()
+        for obj in (viewset, *views):
+            for attribute in ("introduced_in", "removed_in"):
+                if version := getattr(obj, attribute, None):
+                    registered.append((obj, attribute, version))
+    return registered
+
+
+def check_registered_versions(app_configs=None, **kwargs) -> list[Error]:
+    """System check which reports the versions that freeze() would reject, so that they fail at
+    boot even in projects which don't call it."""
+    if getattr(settings, "ROOT_URLCONF", None):
+        get_resolver().url_patterns  # imports the URLconf, and so every view
+    registry = Version.registry()
+    return [
+        Error(str(VersionNotInVersionListError(obj.__qualname__, version)), obj=obj, id=ERROR_ID)
+        for obj, attribute, version in get_registered_versions()
+        if version not in registry.versions
+    ]
+
+
+def merge_registrations(source, target) -> None:
+    """Add the registrations of source to those of the equal Version target."""
+    for attribute in REGISTRATION_ATTRIBUTES:
+        registered = getattr(target, attribute)
+        for obj in getattr(source, attribute):
+            if obj not in registered:
+                target.register(attribute, obj)
+                registered = getattr(target, attribute)
+
+
+def get_subclasses(cls) -> list[type]:
+    subclasses = []
+    queue = list(cls.__subclasses__())
+    while queue:
+        subclass = queue.pop(0)
+        if subclass not in subclasses:
+            subclasses.append(subclass)
+            queue.extend(subclass.__subclasses__())
+    return subclasses
+
+
+def is_versioned_serializer(serializer_class) -> bool:
+    return isinstance(serializer_class, type) and issubclass(serializer_class, VersionedSerializer)
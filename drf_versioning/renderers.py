@@ -0,0 +1,150 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, Optional
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+from .serializers import VersionedSerializer
+
+# Stands in for the list of results in a pagination envelope, so that the envelope can be
+# rendered around results which haven't been serialized yet.
+RESULTS_PLACEHOLDER = "__drf_versioning_results__"
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """
+    A JSONRenderer which can also render a list in chunks, for StreamingListModelMixin. The output
+    is the same as JSONRenderer.render would produce for the whole list at once, including when
+    the client asks for indentation.
+    """
+
+    def render_stream(
+        self,
+        chunks: Iterable[list],
+        envelope: Optional[dict] = None,
+        accepted_media_type=None,
+        renderer_context=None,
+    ) -> Iterator[bytes]:
+        """
+        Render the items in chunks (lists of serialized data) as a single JSON list. If an
+        envelope is given, the list is rendered in place of RESULTS_PLACEHOLDER in it.
+        """
+        prefix, suffix = b"", b""
+        if envelope is not None:
+            rendered = self.render(envelope, accepted_media_type, renderer_context)
+            prefix, suffix = rendered.split(f'"{RESULTS_PLACEHOLDER}"'.encode(), 1)
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        # what JSONRenderer puts between the items of a list
+        separator = b"," if indent or self.compact else b", "
+        # with indentation, the items go on their own lines, indented one level deeper than the
+        # line of the list itself
+        newline = b"\n" if indent else b""
+        line = prefix.rsplit(b"\n", 1)[-1]
+        margin = line[: len(line) - len(line.lstrip())] if indent else b""
+
+        yield prefix + b"["
+        empty = True
+        for chunk in chunks:
+            if not chunk:
+                continue
+            rendered = self.render(chunk, accepted_media_type, renderer_context)
+            # strip the brackets (and their newlines) so that the chunks can be joined into one
+            # list
+            items = rendered[1 + len(newline) : -1 - len(newline)]
+            if margin:
+                items = b"\n".join(margin + item_line for item_line in items.split(b"\n"))
+            yield (newline if empty else separator + newline) + items
+            empty = False
+        yield (b"]" if empty else newline + margin + b"]") + suffix
+
+
+def get_rows(data) -> list:
+    """The rows to render for the response data: the results of a paginated list, the items of a
+    list, or a single object."""
+    if isinstance(data, dict):
+        return data["results"] if isinstance(data.get("results"), list) else [data]
+    return list(data)
+
+
+class NDJSONRenderer(JSONRenderer):
+    """
+    Renders a list as newline-delimited JSON: one object per line. Any pagination envelope is
+    left out.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render_rows(self, rows: list) -> bytes:
+        # render each row without indentation, so that it fits on a single line
+        return b"".join(JSONRenderer.render(self, row) + b"\n" for row in rows)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return self.render_rows(get_rows(data))
+
+    def render_stream(self, chunks, envelope=None, accepted_media_type=None, renderer_context=None):
+        for chunk in chunks:
+            yield self.render_rows(chunk)
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Renders a list as CSV, with one row per object. Any pagination envelope is left out.
+
+    The header is the representation's field names for the request version (see
+    VersionedSerializer.get_representation_field_names) or, failing that, the keys of the first
+    row. Values which aren't scalars are rendered as JSON.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+    encoder_class = encoders.JSONEncoder
+
+    def get_header(self, renderer_context) -> Optional[list]:
+        renderer_context = renderer_context or {}
+        response = renderer_context.get("response")
+        if response is not None and response.exception:
+            return None  # error details aren't shaped like the serializer
+        view = renderer_context.get("view")
+        get_serializer = getattr(view, "get_serializer", None)
+        if get_serializer is not None:
+            serializer = get_serializer()
+            if isinstance(serializer, VersionedSerializer):
+                return serializer.get_representation_field_names()
+        return None
+
+    def format_value(self, value):
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, cls=self.encoder_class)
+        return value
+
+    def render_stream(self, chunks, envelope=None, accepted_media_type=None, renderer_context=None):
+        buffer = io.StringIO()
+        header = self.get_header(renderer_context)
+        writer = None
+        for chunk in chunks:
+            if writer is None:
+                fieldnames = header or list(chunk[0])
+                writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+                writer.writeheader()
+            for row in chunk:
+                writer.writerow({key: self.format_value(value) for key, value in row.items()})
+            yield buffer.getvalue().encode(self.charset)
+            buffer.seek(0)
+            buffer.truncate()
+        if writer is None and header:
+            csv.writer(buffer).writerow(header)
+            yield buffer.getvalue().encode(self.charset)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = get_rows(data)
+        chunks = [rows] if rows else []
+        return b"".join(self.render_stream(chunks, None, accepted_media_type, renderer_context))
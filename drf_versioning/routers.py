@@ -0,0 +1,109 @@
+import re
+from functools import wraps
+from typing import Optional
+
+from django.http import Http404
+from django.urls import include, re_path
+from rest_framework.routers import DefaultRouter
+from rest_framework.settings import api_settings
+
+from drf_versioning.decorators.utils import get_version_window
+from drf_versioning.settings import versioning_settings
+
+Version = versioning_settings.VERSION_MODEL
+
+
+class VersionedRouter(DefaultRouter):
+    """
+    A DefaultRouter which builds a separate route table for each Version in the VERSION_LIST,
+    containing only the endpoints and actions which are available in that version.
+
+    `get_urls()` prefixes each table with its version, e.g. `2.0.0/thing/`, and captures it in the
+    URL kwarg used by URLPathVersioning. Requests for an endpoint which doesn't exist in the
+    requested version fail to resolve, and requests for an action which doesn't exist yet (or any
+    more) are rejected with a 404 before they reach the viewset, so neither costs a trip through
+    authentication and permissions.
+
+    `get_urls_for_version()` returns a single table, e.g. for use with NamespaceVersioning.
+    """
+
+    version_param = api_settings.VERSION_PARAM
+
+    def __init__(self, *args, **kwargs):
+        self.version: Optional[Version] = None  # the version whose route table is being built
+        super().__init__(*args, **kwargs)
+
+    def get_urls(self):
+        urls = []
+        for version in Version.registry().ordered:
+            regex = rf"^(?P<{self.version_param}>{re.escape(str(version))})/"
+            urls.append(re_path(regex, include(self.get_urls_for_version(version))))
+        return urls
+
+    def get_urls_for_version(self, version: Version) -> list:
+        self.version = version
+        try:
+            urls = super().get_urls()
+        finally:
+            self.version = None
+
+        # Actions which have a route in this version, but which aren't available for every HTTP
+        # method, e.g. GET /thing/ (list) in a version where POST /thing/ (create) already exists.
+        unavailable_methods = {}
+        for prefix, viewset, basename in self.registry:
+            for route in self.get_routes(viewset):
+                bound_methods = super().get_method_map(viewset, route.mapping)
+                methods = {
+                    method
+                    for method, action in bound_methods.items()
+                    if not self.is_available(viewset, action, version)
+                }
+                if methods:
+                    unavailable_methods[(viewset, route.name.format(basename=basename))] = methods
+
+        for url in urls:
+            viewset = getattr(url.callback, "cls", None)
+            if methods := unavailable_methods.get((viewset, url.name)):
+                url.callback = reject_methods(url.callback, methods)
+        return urls
+
+    def get_method_map(self, viewset, method_map):
+        bound_methods = super().get_method_map(viewset, method_map)
+        if self.version is None:
+            return bound_methods
+        return {
+            method: action
+            for method, action in bound_methods.items()
+            if self.is_available(viewset, action, self.version)
+        }
+
+    @staticmethod
+    def get_version_window(viewset, action: str) -> tuple[Optional[Version], Optional[Version]]:
+        """The [min_version, max_version) window in which `action` is available on `viewset`."""
+        if window := getattr(viewset, "version_windows", {}).get(action):
+            return window
+        view = getattr(viewset, action, None)
+        if hasattr(view, "version_windows"):  # decorated with versioned_view
+            return get_version_window(view, viewset)
+        return getattr(viewset, "version_window", (None, None))
+
+    def is_available(self, viewset, action: str, version: Version) -> bool:
+        min_version, max_version = self.get_version_window(viewset, action)
+        if min_version is not None and version < min_version:
+            return False
+        if max_version is not None and version >= max_version:
+            return False
+        return True
+
+
+def reject_methods(view, methods: set[str]):
+    """Wrap a view function so that requests with one of the given HTTP methods get a 404 without
+    calling the view."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method.lower() in methods:
+            raise Http404()
+        return view(request, *args, **kwargs)
+
+    return wrapper
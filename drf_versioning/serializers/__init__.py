@@ -1 +1 @@
-from .versioned_serializer import VersionedSerializer
+from .versioned_serializer import VersionedSerializer, VersionedListSerializer
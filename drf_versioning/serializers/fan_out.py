@@ -0,0 +1,93 @@
+import copy
+from functools import cache, partial
+from typing import Callable
+
+from django.db import models
+from rest_framework import serializers
+
+from drf_versioning.settings import versioning_settings
+
+Version = versioning_settings.VERSION_MODEL
+
+
+class RequestAtVersion:
+    """Stands in for the request, as if it had been made for another version."""
+
+    def __init__(self, request, version: Version):
+        self._request = request
+        self.version = version
+        self.is_latest_version = version is Version.get_latest()
+
+    def __getattr__(self, name):
+        return getattr(self._request, name)
+
+
+class FanOut:
+    """
+    The latest representation of an instance, from which the representation at any older version
+    can be derived without serializing the instance again (see
+    VersionedSerializer.to_representations).
+
+    Nested versioned serializers get a FanOut of their own, because their transforms have to be
+    applied to their part of the data before the parent's transforms run, as they would be in
+    normal serialization. Parts of the data which no transform touches for a version are shared
+    between the representations rather than copied, so the representations must be treated as
+    read-only.
+    """
+
+    def __init__(self, serializer, data: dict, get_instance: Callable):
+        from .versioned_serializer import VersionedSerializer
+
+        self.serializer = serializer
+        self.data = data
+        # Only custom transforms need the instance, so nested instances are only looked up (which
+        # could mean querying them again) if they are needed.
+        self.get_instance = cache(get_instance)
+        self.children = {}  # field name -> FanOut, or list of FanOuts for many=True
+        for name, field in serializer.fields.items():
+            many = isinstance(field, serializers.ListSerializer)
+            child = field.child if many else field
+            if not isinstance(child, VersionedSerializer) or data.get(name) is None:
+                continue
+            get_child_instance = cache(partial(self.get_child_instance, field, many))
+            if many:
+                self.children[name] = [
+                    FanOut(child, item, lambda ii=ii: get_child_instance()[ii])
+                    for ii, item in enumerate(data[name])
+                ]
+            else:
+                self.children[name] = FanOut(child, data[name], get_child_instance)
+
+    def get_child_instance(self, field, many: bool):
+        child_instance = field.get_attribute(self.get_instance())
+        if many:
+            if isinstance(child_instance, models.manager.BaseManager):
+                child_instance = child_instance.all()
+            return list(child_instance)
+        return child_instance
+
+    def at(self, version: Version, request=None):
+        """The representation at version. request is passed to the transforms."""
+        nested = {}
+        for name, child in self.children.items():
+            if isinstance(child, list):
+                items = [item.at(version, request) for item in child]
+                unchanged = all(new is old for new, old in zip(items, self.data[name]))
+                nested[name] = self.data[name] if unchanged else items
+            else:
+                nested[name] = child.at(version, request)
+
+        plan = self.serializer.get_transform_plan(version)
+        if not plan.representation_transforms:
+            if all(value is self.data[name] for name, value in nested.items()):
+                return self.data  # nothing has changed, so share the latest data
+            return {**self.data, **nested}
+
+        if plan.is_declarative:
+            data = {**self.data, **nested}  # declarative transforms only replace top-level keys
+        else:
+            # a custom transform could change nested data in place
+            data = copy.deepcopy({**self.data, **nested})
+        request = RequestAtVersion(request, version)
+        plan.to_representation(data, request, None if plan.is_declarative else self.get_instance())
+        return data
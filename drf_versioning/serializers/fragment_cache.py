@@ -0,0 +1,61 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+from drf_versioning.settings import versioning_settings_changed
+
+
+class FragmentCache:
+    """
+    A bounded, thread-safe LRU cache of serialized representations. Callers are free to modify
+    what they get back (the transforms of a parent serializer do), so values are copied on the
+    way in and on the way out.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_many(self, keys: list[Hashable]) -> dict:
+        found = {}
+        with self.lock:
+            for key in keys:
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+                    found[key] = self.entries[key]
+        return {key: copy.deepcopy(value) for key, value in found.items()}
+
+    def set_many(self, values: dict):
+        values = {key: copy.deepcopy(value) for key, value in values.items()}
+        with self.lock:
+            self.entries.update(values)
+            for key in values:
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+_fragment_caches: dict[type, FragmentCache] = {}
+
+
+def get_fragment_cache(serializer_class: type) -> FragmentCache:
+    """The in-process FragmentCache of the serializer class."""
+    try:
+        return _fragment_caches[serializer_class]
+    except KeyError:
+        cache = FragmentCache(serializer_class.fragment_cache_size)
+        return _fragment_caches.setdefault(serializer_class, cache)
+
+
+def clear_fragment_caches(*args, **kwargs):
+    for cache in list(_fragment_caches.values()):
+        cache.clear()
+
+
+versioning_settings_changed.connect(clear_fragment_caches)
@@ -0,0 +1,122 @@
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import serializers
+
+from ..settings import versioning_settings, versioning_settings_changed
+from ..transforms import AddField
+from ..transforms.plan import get_transform_plan
+
+Version = versioning_settings.VERSION_MODEL
+
+
+class QuerysetPlan:
+    """
+    How to load the data a VersionedSerializer needs for one request version:
+    - select_related / prefetch_related: the lookups declared on the serializer's AddFields whose
+      field exists in this version
+    - defer: the columns declared on the serializer's AddFields whose field doesn't exist in this
+      version (and which no present AddField declares too)
+
+    The lookups of all the AddFields are checked against the model when the plan is built, so
+    that typos fail then, rather than on the first request which needs them.
+    """
+
+    def __init__(self, serializer_class, version: Version, model: type[models.Model]):
+        plan = get_transform_plan(serializer_class, serializer_class.transforms, version)
+        add_fields = [
+            transform
+            for transform in serializer_class.transforms
+            if issubclass(transform, AddField)
+        ]
+        for transform in add_fields:
+            self.check_lookups(transform, model)
+        present = [
+            transform for transform in add_fields if transform not in plan.representation_transforms
+        ]
+        absent = [
+            transform for transform in add_fields if transform in plan.representation_transforms
+        ]
+        self.select_related = tuple(
+            lookup for transform in present for lookup in transform.select_related
+        )
+        self.prefetch_related = tuple(
+            lookup for transform in present for lookup in transform.prefetch_related
+        )
+        used = {name for transform in present for name in transform.defer}
+        self.defer = tuple(
+            dict.fromkeys(
+                name for transform in absent for name in transform.defer if name not in used
+            )
+        )
+
+    @classmethod
+    def check_lookups(cls, transform: type[AddField], model: type[models.Model]) -> None:
+        for lookup in transform.select_related:
+            if cls.get_path_model(transform, "select_related", lookup, model) is None:
+                raise ImproperlyConfigured(
+                    f"{transform.__qualname__}.select_related: {lookup!r} is not a relation"
+                )
+        for lookup in transform.defer:
+            cls.get_path_model(transform, "defer", lookup, model)
+        for lookup in transform.prefetch_related:
+            # a string, or a Prefetch. Prefetching can follow attributes which aren't fields
+            # (e.g. GenericForeignKeys), so only the first one is checked.
+            name = getattr(lookup, "prefetch_through", lookup).split(LOOKUP_SEP)[0]
+            if not hasattr(model, name):
+                raise ImproperlyConfigured(
+                    f"{transform.__qualname__}.prefetch_related: {model.__name__} has no "
+                    f"attribute {name!r}"
+                )
+
+    @staticmethod
+    def get_path_model(transform, attribute: str, lookup: str, model: type[models.Model]):
+        """Follow the field names of the lookup from the model, and return the model which the
+        last one relates to (None if it isn't a relation)."""
+        for name in lookup.split(LOOKUP_SEP):
+            if model is None:
+                raise ImproperlyConfigured(
+                    f"{transform.__qualname__}.{attribute}: {lookup!r} follows a field which is "
+                    f"not a relation"
+                )
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                raise ImproperlyConfigured(
+                    f"{transform.__qualname__}.{attribute}: {model.__name__} has no field {name!r}"
+                )
+            model = field.related_model if field.is_relation else None
+        return model
+
+    def apply(self, queryset: models.QuerySet, keep: tuple[str, ...] = ()) -> models.QuerySet:
+        """keep: fields which are needed for something else, and so mustn't be deferred."""
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if defer := [name for name in self.defer if name not in keep]:
+            queryset = queryset.defer(*defer)
+        return queryset
+
+
+_queryset_plans: dict[tuple, QuerysetPlan] = {}
+
+
+def get_queryset_plan(
+    serializer_class: type[serializers.Serializer], version: Version, model: type[models.Model]
+) -> QuerysetPlan:
+    """Build the QuerysetPlan for (serializer_class, version, model) on first use, and reuse it
+    afterwards."""
+    key = (serializer_class, version, model)
+    try:
+        return _queryset_plans[key]
+    except KeyError:
+        plan = _queryset_plans[key] = QuerysetPlan(serializer_class, version, model)
+        return plan
+
+
+def clear_queryset_plans(*args, **kwargs):
+    _queryset_plans.clear()
+
+
+versioning_settings_changed.connect(clear_queryset_plans)
@@ -1,16 +1,111 @@
+import copy
+import hashlib
+from typing import Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import models
 from django.http import QueryDict
 from rest_framework import serializers
 
+from ..cache import make_key
 from ..exceptions import TransformsNotDeclaredError
+from ..middleware import is_latest_version
 from ..transforms import Transform
-from drf_versioning.settings import versioning_settings
+from ..transforms.plan import TransformPlan, get_canonical_version, get_transform_plan
+from .fan_out import FanOut, RequestAtVersion
+from .fragment_cache import get_fragment_cache
+from drf_versioning.settings import versioning_settings, versioning_settings_changed
 
 Version = versioning_settings.VERSION_MODEL
 
+# (serializer class, request version, pruned) -> unbound field instances, see
+# VersionedSerializer.get_fields
+_field_maps: dict[tuple, dict] = {}
+
+
+# (serializer class, version) -> fingerprint, see VersionedSerializer.get_plan_fingerprint
+_plan_fingerprints: dict[tuple, str] = {}
+
+
+def clear_field_maps(*args, **kwargs):
+    _field_maps.clear()
+    _plan_fingerprints.clear()
+
+
+versioning_settings_changed.connect(clear_field_maps)
+
+
+class VersionedListSerializer(serializers.ListSerializer):
+    """
+    Used automatically by VersionedSerializer when many=True. Serializes every item first, and
+    then applies each transform once to the whole list (via Transform.to_representation_batch)
+    instead of once per item.
+
+    If the child serializer overrides to_representation, it is called for each item instead, as
+    ListSerializer does.
+    """
+
+    def to_representation(self, data):
+        # Dealing with nested relationships, data can be a Manager,
+        # so, first get a queryset from the Manager if needed
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        if type(self.child).to_representation is not VersionedSerializer.to_representation:
+            return [self.child.to_representation(item) for item in iterable]
+        if self.child.fragment_cache_token is None and not self.child._get_transform_version():
+            # nothing to transform, so this is plain ListSerializer.to_representation
+            to_representation = super(VersionedSerializer, self.child).to_representation
+            return [to_representation(item) for item in iterable]
+
+        instances = list(iterable)
+        if self.child.fragment_cache_token is None:
+            representations = [self.child.to_latest_representation(item) for item in instances]
+            return self.child.transform_representations(representations, instances)
+
+        # only serialize the instances which aren't in the fragment cache
+        keys = [self.child.get_fragment_key(instance) for instance in instances]
+        cached = self.child.get_cached_fragments(keys)
+        missing = [instance for key, instance in zip(keys, instances) if key not in cached]
+        if missing:
+            representations = [self.child.to_latest_representation(item) for item in missing]
+            representations = self.child.transform_representations(representations, missing)
+            computed = {
+                self.child.get_fragment_key(instance): representation
+                for instance, representation in zip(missing, representations)
+            }
+            self.child.cache_fragments(computed)
+            cached.update(computed)
+        return [cached[key] for key in keys]
+
 
 class VersionedSerializer(serializers.Serializer):
     transforms: tuple[type[Transform]] = None
 
+    # Build the fields once per request version, and give each instance copies of them. Set this to
+    # False if get_fields depends on anything other than the serializer class and request version.
+    cache_fields: bool = True
+
+    # Opt-in cache of each instance's representation, keyed by the serializer class, the
+    # instance's pk, the value of its fragment_cache_token attribute (e.g. a last-modified
+    # timestamp, which must change whenever the representation would), and the request version.
+    # Entries are kept in an LRU cache of fragment_cache_size entries per serializer class, and,
+    # if fragment_cache_alias is set, in that Django cache for fragment_cache_timeout seconds (by
+    # default, the cache's TIMEOUT).
+    # The representation must not depend on anything else about the request (such as the user).
+    fragment_cache_token: Optional[str] = None
+    fragment_cache_size: int = 1024
+    fragment_cache_alias: Optional[str] = None
+    fragment_cache_timeout: Optional[int] = DEFAULT_TIMEOUT
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Use VersionedListSerializer for many=True, unless the subclass chose its own list
+        # serializer. The Meta is subclassed rather than modified, because it might be shared
+        # with other serializers.
+        meta = getattr(cls, "Meta", object)
+        if not hasattr(meta, "list_serializer_class"):
+            cls.Meta = type("Meta", (meta,), {"list_serializer_class": VersionedListSerializer})
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.check_transforms_declared()
@@ -26,12 +121,136 @@ class VersionedSerializer(serializers.Serializer):
         if request and hasattr(request, "version"):
             return request.version
 
+    def _get_transform_version(self):
+        """The version to transform the data for, or None if there is nothing to transform
+        because the request has no version, or it's for the latest version. Like the fields, this
+        is worked out once per serializer instance."""
+        try:
+            return self._transform_version
+        except AttributeError:
+            request = self.context.get("request")
+            if request is None or is_latest_version(request):
+                version = None
+            else:
+                version = getattr(request, "version", None)
+                if version is not None:
+                    # e.g. a string, or a Version equal to one of the VERSION_LIST. The canonical
+                    # instance keeps the plan and field map caches to one entry per version.
+                    version = get_canonical_version(version)
+                    if version is Version.get_latest():
+                        version = None
+            self._transform_version = version
+            return version
+
+    @classmethod
+    def get_plan_fingerprint(cls, version: Version) -> str:
+        """
+        Identifies the transforms which apply to the serializer's representation (including those
+        of nested versioned serializers) at the version, so that it changes when they do.
+        """
+        key = (cls, version)
+        try:
+            return _plan_fingerprints[key]
+        except KeyError:
+            pass
+        transforms = []
+        serializer_classes = [cls]
+        while serializer_classes:
+            serializer_class = serializer_classes.pop()
+            plan = get_transform_plan(serializer_class, serializer_class.transforms, version)
+            transforms.append(serializer_class.__qualname__)
+            transforms.extend(
+                f"{transform.__module__}.{transform.__qualname__}"
+                for transform in plan.representation_transforms
+            )
+            for field in serializer_class().fields.values():
+                field = getattr(field, "child", field)
+                if isinstance(field, VersionedSerializer):
+                    serializer_classes.append(field.__class__)
+        fingerprint = hashlib.md5(repr(transforms).encode(), usedforsecurity=False).hexdigest()
+        _plan_fingerprints[key] = fingerprint
+        return fingerprint
+
+    @classmethod
+    def prepare(cls, versions) -> None:
+        """
+        Build everything that is otherwise built on first use for each version: the transform
+        plans, the plan fingerprints and the output field maps. See drf_versioning.registry.freeze.
+        """
+        for version in versions:
+            get_transform_plan(cls, cls.transforms, version)
+            cls.get_plan_fingerprint(version)
+        latest = Version.get_latest()
+        for version in (None, *versions):
+            if version is latest:
+                continue
+            serializer = cls()
+            serializer._transform_version = version
+            serializer.fields  # builds and caches the field map
+
+    def get_transform_plan(self, version: Version) -> TransformPlan:
+        return get_transform_plan(self.__class__, self.transforms, version)
+
     def transforms_for_version(self, version: Version, reverse=False) -> list[type[Transform]]:
-        return sorted(
-            filter(lambda transform: version < transform.version, self.transforms),
-            key=lambda transform: transform.version,
-            reverse=reverse,
+        plan = self.get_transform_plan(version)
+        if reverse:
+            return list(plan.representation_transforms)
+        return list(plan.internal_value_transforms)
+
+    def get_fields(self):
+        """
+        Returns the fields for the request version, built once per serializer class and version.
+
+        When the serializer is only used for output, the fields which the transforms would remove
+        (see TransformPlan.skipped_fields) are left out completely.
+        """
+        request_version = self._get_transform_version()
+        prune = bool(request_version) and not hasattr(self.root, "initial_data")
+        if not self.cache_fields:
+            fields = super().get_fields()
+            return self.prune_fields(fields, request_version) if prune else fields
+
+        key = (self.__class__, request_version, prune)
+        try:
+            fields = _field_maps[key]
+        except KeyError:
+            fields = super().get_fields()
+            if prune:
+                fields = self.prune_fields(fields, request_version)
+            _field_maps[key] = fields
+        # fields get bound to the serializer instance, so each instance needs its own copies
+        return copy.deepcopy(fields)
+
+    def prune_fields(self, fields: dict, version: Version) -> dict:
+        """Leave out the fields which the transforms for the version would remove anyway, so that
+        they aren't computed for nothing."""
+        skipped_fields = self.get_transform_plan(version).skipped_fields
+        return {name: field for name, field in fields.items() if name not in skipped_fields}
+
+    def get_representation_field_names(self) -> Optional[list[str]]:
+        """The keys of the representation for the request version, in order, or None if they
+        depend on the data (see TransformPlan.get_representation_keys)."""
+        field_names = [field.field_name for field in self._readable_fields]
+        if request_version := self._get_transform_version():
+            plan = self.get_transform_plan(request_version)
+            return plan.get_representation_keys(field_names)
+        return field_names
+
+    def to_representations(self, instance, versions) -> dict:
+        """
+        Serializes the instance once, at the latest version, and derives its representation at
+        each of the versions from that, applying only the transforms each version needs. Returns
+        {version: representation}. Unchanged parts of the data are shared between the
+        representations, so they must not be modified.
+        """
+        request = self.context.get("request")
+        latest_serializer = self.__class__(
+            context={**self.context, "request": RequestAtVersion(request, Version.get_latest())}
         )
+        data = latest_serializer.to_representation(instance)
+        fan_out = FanOut(latest_serializer, data, lambda: instance)
+        versions = [Version.get(version) for version in versions]
+        return {version: fan_out.at(version, request) for version in versions}
 
     def to_representation(self, instance):
         """
@@ -39,19 +258,70 @@ class VersionedSerializer(serializers.Serializer):
         backwards order against the serialized representation to convert the highest supported
         version into the requested version of the resource.
         """
-        data = super().to_representation(instance)
+        if self.fragment_cache_token is not None:
+            key = self.get_fragment_key(instance)
+            if cached := self.get_cached_fragments([key]):
+                return cached[key]
+
+        data = self.to_latest_representation(instance)
+        request = self.context.get("request")
+        if request_version := self._get_transform_version():
+            self.get_transform_plan(request_version).to_representation(data, request, instance)
+
+        if self.fragment_cache_token is not None:
+            self.cache_fragments({key: data})
+        return data
+
+    def get_fragment_key(self, instance) -> tuple:
+        # The latest version is keyed by its number too, so that the representations cached for it
+        # aren't served once a newer version is released.
+        version = self._get_transform_version() or Version.get_latest()
+        return (
+            self.__class__.__module__,
+            self.__class__.__qualname__,
+            instance.pk,
+            getattr(instance, self.fragment_cache_token),
+            str(version),
+        )
+
+    def get_cached_fragments(self, keys: list[tuple]) -> dict:
+        """{key: representation} for those of the keys which are in the fragment cache."""
+        fragment_cache = get_fragment_cache(self.__class__)
+        found = fragment_cache.get_many(keys)
+        if self.fragment_cache_alias is not None and len(found) < len(keys):
+            missing = {make_key(*key): key for key in keys if key not in found}
+            shared = caches[self.fragment_cache_alias].get_many(list(missing))
+            shared = {missing[cache_key]: value for cache_key, value in shared.items()}
+            fragment_cache.set_many(shared)
+            found.update(shared)
+        return found
+
+    def cache_fragments(self, representations: dict):
+        get_fragment_cache(self.__class__).set_many(representations)
+        if self.fragment_cache_alias is not None:
+            caches[self.fragment_cache_alias].set_many(
+                {make_key(*key): value for key, value in representations.items()},
+                self.fragment_cache_timeout,
+            )
+
+    def to_latest_representation(self, instance):
+        """Serializes the instance without applying any version transforms."""
+        return super().to_representation(instance)
+
+    def transform_representations(self, data: list[dict], instances: list) -> list[dict]:
+        """Executes the version transforms against a list of serialized representations
+        (data[i] being the representation of instances[i]), one transform at a time."""
         request = self.context.get("request")
-        if request_version := self._get_request_version():
-            for transform in self.transforms_for_version(version=request_version, reverse=True):
-                transform().to_representation(data, request, instance)
+        if request_version := self._get_transform_version():
+            plan = self.get_transform_plan(request_version)
+            plan.to_representation_batch(data, request, instances)
 
         return data
 
     def to_internal_value(self, data: QueryDict):
         data = data.copy()  # immutable QueryDict to mutable dict
         request = self.context.get("request")
-        if request_version := self._get_request_version():
-            for transform in self.transforms_for_version(version=request_version, reverse=False):
-                transform().to_internal_value(data, request)
+        if request_version := self._get_transform_version():
+            self.get_transform_plan(request_version).to_internal_value(data, request)
 
         return super().to_internal_value(data)
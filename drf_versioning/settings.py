@@ -3,6 +3,7 @@ Inspired by (shamelessly pinched from) rest_framework.settings :)
 """
 
 from django.conf import settings
+from django.dispatch import Signal
 from django.test.signals import setting_changed
 from rest_framework.settings import perform_import
 
@@ -77,11 +78,16 @@ class VersioningSettings:
 
 versioning_settings = VersioningSettings(None, DEFAULTS, IMPORT_STRINGS)
 
+# Sent after the versioning settings are reloaded, so that anything derived from them (e.g. cached
+# transform plans) can be thrown away.
+versioning_settings_changed = Signal()
+
 
 def reload_versioning_settings(*args, **kwargs):
     setting = kwargs["setting"]
     if setting == "DRF_VERSIONING_SETTINGS":
         versioning_settings.reload()
+        versioning_settings_changed.send(sender=VersioningSettings)
 
 
 setting_changed.connect(reload_versioning_settings)
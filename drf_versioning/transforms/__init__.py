@@ -1,2 +1,2 @@
 from .transform import Transform
-from .common import AddField, RemoveField
+from .common import AddField, RemoveField, RenameField
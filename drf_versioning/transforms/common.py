@@ -1,8 +1,28 @@
-from .transform import Transform
+from .transform import Transform, is_unmodified
 
 
 class AddField(Transform):
     field_name: str
+    # Queryset lookups which are only needed to serialize this field. VersionedViewSet only applies
+    # them for request versions which have the field.
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple = ()
+    # Model columns which are only needed to serialize this field. VersionedViewSet defers them for
+    # request versions which don't have the field. Only declare columns which nothing else (e.g. a
+    # SerializerMethodField or property) reads, or every instance will load them with an extra
+    # query.
+    defer: tuple[str, ...] = ()
+    stateless = True
+
+    @classmethod
+    def get_representation_operations(cls):
+        if is_unmodified(cls, AddField):
+            return [("pop", cls.field_name)]
+
+    @classmethod
+    def get_internal_value_operations(cls):
+        if is_unmodified(cls, AddField):
+            return [("pop", cls.field_name)]
 
     def to_internal_value(self, data: dict, request):
         data.pop(self.field_name, None)
@@ -12,10 +32,27 @@ class AddField(Transform):
         data.pop(self.field_name, None)
         return data
 
+    def to_representation_batch(self, data: list[dict], request, instances: list):
+        field_name = self.field_name
+        for item in data:
+            item.pop(field_name, None)
+        return data
+
 
 class RemoveField(Transform):
     field_name: str
     null_value = None  # the value to serialize for the removed field for old versions
+    stateless = True
+
+    @classmethod
+    def get_representation_operations(cls):
+        if is_unmodified(cls, RemoveField):
+            return [("set", cls.field_name, cls.null_value)]
+
+    @classmethod
+    def get_internal_value_operations(cls):
+        if is_unmodified(cls, RemoveField):
+            return [("pop", cls.field_name)]
 
     def to_internal_value(self, data: dict, request):
         data.pop(self.field_name, None)
@@ -24,3 +61,42 @@ class RemoveField(Transform):
     def to_representation(self, data: dict, request, instance):
         data[self.field_name] = self.null_value
         return data
+
+    def to_representation_batch(self, data: list[dict], request, instances: list):
+        field_name, null_value = self.field_name, self.null_value
+        for item in data:
+            item[field_name] = null_value
+        return data
+
+
+class RenameField(Transform):
+    """Renames a field from old_field_name (in older versions) to new_field_name"""
+
+    old_field_name: str
+    new_field_name: str
+    stateless = True
+
+    @classmethod
+    def get_representation_operations(cls):
+        if is_unmodified(cls, RenameField):
+            return [("move", cls.new_field_name, cls.old_field_name)]
+
+    @classmethod
+    def get_internal_value_operations(cls):
+        if is_unmodified(cls, RenameField):
+            return [("move", cls.old_field_name, cls.new_field_name)]
+
+    @staticmethod
+    def move(data: dict, source: str, target: str):
+        if source in data:
+            data[target] = data.pop(source)
+        else:
+            data.pop(target, None)
+
+    def to_internal_value(self, data: dict, request):
+        self.move(data, self.old_field_name, self.new_field_name)
+        return data
+
+    def to_representation(self, data: dict, request, instance):
+        self.move(data, self.new_field_name, self.old_field_name)
+        return data
@@ -0,0 +1,119 @@
+"""
+Compiles a chain of transforms into a single Python function, much like dataclasses generates
+__init__. Each run of declarative transforms (see Transform.get_representation_operations) is
+simplified to its net effect and inlined as plain dict operations, and any other transform is
+called directly.
+"""
+
+from typing import Callable, Iterable
+
+from .operations import simplify
+from .transform import Transform
+
+
+class FunctionBuilder:
+    def __init__(self, name: str, args: str):
+        self.name = name
+        self.args = args
+        self.namespace = {}  # the globals of the generated function
+        self.lines = []
+
+    def reference(self, value) -> str:
+        """Make `value` available to the generated code, and return the name to use for it."""
+        name = f"_{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def literal(self, key) -> str:
+        return repr(key) if isinstance(key, str) else self.reference(key)
+
+    def add_operations(self, operations: list[tuple], target: str, indent: str = ""):
+        for operation in operations:
+            kind, key, *args = operation
+            key = self.literal(key)
+            if kind == "pop":
+                self.lines.append(f"{indent}{target}.pop({key}, None)")
+            elif kind == "set":
+                value = self.reference(args[0])
+                self.lines.append(f"{indent}{target}[{key}] = {value}")
+            elif kind == "move":
+                destination = self.literal(args[0])
+                self.lines.append(f"{indent}if {key} in {target}:")
+                self.lines.append(f"{indent}    {target}[{destination}] = {target}.pop({key})")
+                self.lines.append(f"{indent}else:")
+                self.lines.append(f"{indent}    {target}.pop({destination}, None)")
+
+    def add_call(self, transform: type[Transform], method: str, args: str):
+        """Call transform.method(args), reusing a single instance if the transform is
+        stateless."""
+        if transform.stateless:
+            name = self.reference(getattr(transform(), method))
+            self.lines.append(f"{name}({args})")
+        else:
+            name = self.reference(transform)
+            self.lines.append(f"{name}().{method}({args})")
+
+    def build(self, returns: str) -> Callable:
+        body = "\n".join(f"    {line}" for line in self.lines + [f"return {returns}"])
+        source = f"def {self.name}({self.args}):\n{body}\n"
+        exec(compile(source, f"<drf_versioning.transforms {self.name}>", "exec"), self.namespace)
+        function = self.namespace[self.name]
+        function.__source__ = source  # for debugging
+        return function
+
+
+def group_operations(transforms: Iterable[type[Transform]], direction: str):
+    """
+    Yields (transform, None) for each transform which has to be called, and (None, operations)
+    for each run of declarative transforms in between, with their operations concatenated.
+    direction is "representation" or "internal_value".
+    """
+    run = []
+    for transform in transforms:
+        operations = getattr(transform, f"get_{direction}_operations")()
+        if operations is None:
+            if run:
+                yield None, run
+                run = []
+            yield transform, None
+        else:
+            run.extend(operations)
+    if run:
+        yield None, run
+
+
+def compile_representation(transforms: Iterable[type[Transform]]) -> Callable:
+    """Returns to_representation(data, request, instance), which applies the transforms in
+    order."""
+    builder = FunctionBuilder("to_representation", "data, request, instance")
+    for transform, operations in group_operations(transforms, "representation"):
+        if transform:
+            builder.add_call(transform, "to_representation", "data, request, instance")
+        else:
+            builder.add_operations(simplify(operations), target="data")
+    return builder.build(returns="data")
+
+
+def compile_representation_batch(transforms: Iterable[type[Transform]]) -> Callable:
+    """Returns to_representation_batch(data, request, instances), which applies the transforms in
+    order to each item in data. Consecutive declarative transforms share a single loop over the
+    items, and other transforms are called with the whole list."""
+    builder = FunctionBuilder("to_representation_batch", "data, request, instances")
+    for transform, operations in group_operations(transforms, "representation"):
+        if transform:
+            builder.add_call(transform, "to_representation_batch", "data, request, instances")
+        elif operations := simplify(operations):
+            builder.lines.append("for item in data:")
+            builder.add_operations(operations, target="item", indent="    ")
+    return builder.build(returns="data")
+
+
+def compile_internal_value(transforms: Iterable[type[Transform]]) -> Callable:
+    """Returns to_internal_value(data, request), which applies the transforms in order."""
+    builder = FunctionBuilder("to_internal_value", "data, request")
+    for transform, operations in group_operations(transforms, "internal_value"):
+        if transform:
+            builder.add_call(transform, "to_internal_value", "data, request")
+        else:
+            builder.add_operations(simplify(operations), target="data")
+    return builder.build(returns="data")
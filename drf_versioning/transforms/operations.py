@@ -0,0 +1,100 @@
+"""
+Simplification of the declarative operations which transforms use to describe how they change
+the data dict (see Transform.get_representation_operations):
+
+- ("pop", key): remove key, if present
+- ("set", key, value): set key to value
+- ("move", source, target): move the value of source to target. If source is absent, target is
+  removed, so that the target ends up exactly as the source was.
+
+A long chain of transforms often has a much smaller net effect -- a field added in one version
+and removed in a later one, or renamed and then renamed back -- so a run of operations is
+simulated symbolically, and only the net change to each key is emitted.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+
+class _Marker:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+ABSENT = _Marker("ABSENT")  # the key has been removed
+TEMPORARY = _Marker("TEMPORARY")  # a spare key for swapping the values of two keys
+
+
+@dataclass(frozen=True)
+class Original:
+    """The value that `key` held before the operations were applied."""
+
+    key: Hashable
+
+
+@dataclass(frozen=True, eq=False)
+class Constant:
+    value: Any
+
+
+def simulate(operations: list[tuple]) -> dict:
+    """
+    Returns {key: final state} for each key that the operations touch, where the state is one of
+    ABSENT, Original(key) or Constant(value).
+    """
+    state = {}
+    for operation in operations:
+        kind, key, *args = operation
+        if kind == "pop":
+            state[key] = ABSENT
+        elif kind == "set":
+            state[key] = Constant(args[0])
+        elif kind == "move":
+            (target,) = args
+            if key != target:
+                state[target] = state.get(key, Original(key))
+                state[key] = ABSENT
+        else:
+            raise ValueError(f"Unknown transform operation: {operation!r}")
+    return state
+
+
+def simplify(operations: list[tuple]) -> list[tuple]:
+    """Returns the shortest list of operations with the same net effect as `operations`."""
+    state = simulate(operations)
+    changed = {key: value for key, value in state.items() if value != Original(key)}
+    pending = {  # target: source
+        key: value.key for key, value in changed.items() if isinstance(value, Original)
+    }
+    moved = set(pending.values())
+    simplified = []
+    while pending:
+        # a target can only be overwritten once its own value has been moved out of the way
+        sources = set(pending.values())
+        target = next((target for target in pending if target not in sources), None)
+        if target is None:
+            # only cycles are left (e.g. two fields which swap names), so park one value
+            target = next(iter(pending))
+            reader = next(key for key, source in pending.items() if source == target)
+            simplified.append(("move", target, TEMPORARY))
+            pending[reader] = TEMPORARY
+            continue
+        simplified.append(("move", pending.pop(target), target))
+
+    for key, value in changed.items():
+        if value is ABSENT and key not in moved:
+            simplified.append(("pop", key))
+        elif isinstance(value, Constant):
+            simplified.append(("set", key, value.value))
+    return simplified
+
+
+def unread_keys(operations: list[tuple]) -> frozenset:
+    """The keys whose original values don't survive the operations, and so which don't need to
+    be computed in the first place."""
+    state = simulate(operations)
+    read = {value.key for value in state.values() if isinstance(value, Original)}
+    return frozenset(key for key in state if key not in read)
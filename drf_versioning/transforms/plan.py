@@ -0,0 +1,104 @@
+from typing import Optional, Union
+
+from drf_versioning.exceptions import VersionDoesNotExist
+from drf_versioning.settings import versioning_settings, versioning_settings_changed
+from .compiler import (
+    compile_internal_value,
+    compile_representation,
+    compile_representation_batch,
+    group_operations,
+)
+from .operations import unread_keys
+from .transform import Transform
+
+Version = versioning_settings.VERSION_MODEL
+
+
+class TransformPlan:
+    """
+    The transforms that apply to a single request version, filtered and ordered once for each
+    direction of conversion, and compiled into one function per direction:
+
+    - to_representation(data, request, instance)
+    - to_representation_batch(data, request, instances)
+    - to_internal_value(data, request)
+    """
+
+    def __init__(self, transforms: tuple[type[Transform]], version: Union[Version, str]):
+        applicable = [transform for transform in transforms if version < transform.version]
+        self.version = version
+        # oldest first: upgrades incoming data from the request version to the latest version
+        self.internal_value_transforms = tuple(
+            sorted(applicable, key=lambda transform: transform.version)
+        )
+        # newest first: downgrades outgoing data from the latest version to the request version
+        self.representation_transforms = tuple(
+            sorted(applicable, key=lambda transform: transform.version, reverse=True)
+        )
+        self.skipped_fields = self.get_skipped_fields(self.representation_transforms)
+        self.to_representation = compile_representation(self.representation_transforms)
+        self.to_representation_batch = compile_representation_batch(self.representation_transforms)
+        self.to_internal_value = compile_internal_value(self.internal_value_transforms)
+        # whether the output keys only depend on the input keys, see get_representation_keys
+        self.is_declarative = all(
+            transform is None
+            for transform, _ in group_operations(self.representation_transforms, "representation")
+        )
+
+    def get_representation_keys(self, keys: list[str]) -> Optional[list[str]]:
+        """
+        The keys of the transformed representation, in order, given the keys of the latest
+        representation. Returns None if that can't be known without the data, because a custom
+        transform is involved.
+        """
+        if not self.is_declarative:
+            return None
+        data = dict.fromkeys(keys)
+        self.to_representation(data, None, None)
+        return list(data)
+
+    @staticmethod
+    def get_skipped_fields(representation_transforms) -> frozenset[str]:
+        """
+        The output fields which the transforms will remove or overwrite, and so which don't need
+        to be serialized in the first place.
+
+        Only the declarative transforms before the first custom transform are counted, because a
+        custom transform could read any field.
+        """
+        for transform, operations in group_operations(representation_transforms, "representation"):
+            return frozenset() if transform else unread_keys(operations)
+        return frozenset()
+
+
+_plans: dict[tuple, TransformPlan] = {}
+
+
+def get_transform_plan(owner: type, transforms, version: Union[Version, str]) -> TransformPlan:
+    """Build the TransformPlan for (owner, version) on first use, and reuse it afterwards. The
+    plans are stored under the canonical Version from the VERSION_LIST, so that there is at most
+    one per version."""
+    try:
+        return _plans[(owner, version)]
+    except KeyError:
+        version = get_canonical_version(version)
+        key = (owner, version)
+        if key not in _plans:
+            _plans[key] = TransformPlan(transforms, version)
+        return _plans[key]
+
+
+def get_canonical_version(version: Union[Version, str]) -> Union[Version, str]:
+    """The Version from the VERSION_LIST which equals version. Versions which aren't in the list
+    (e.g. those of serializers used outside of a versioned request) are returned as they are."""
+    try:
+        return Version.get(version)
+    except VersionDoesNotExist:
+        return version
+
+
+def clear_transform_plans(*args, **kwargs):
+    _plans.clear()
+
+
+versioning_settings_changed.connect(clear_transform_plans)
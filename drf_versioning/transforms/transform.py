@@ -1,3 +1,5 @@
+from typing import Optional
+
 from drf_versioning.settings import versioning_settings
 
 Version = versioning_settings.VERSION_MODEL
@@ -10,7 +12,7 @@ class TransformMeta(type):
     def __new__(cls, name, bases, dct):
         subclass = super().__new__(cls, name, bases, dct)
         if version := getattr(subclass, "version", None):
-            version.transforms.append(subclass)
+            version.register("transforms", subclass)
         return subclass
 
 
@@ -21,6 +23,9 @@ class Transform(metaclass=TransformMeta):
 
     description: str  # will be added to version.notes
     version: Version  # will be added to version.transforms
+    # Whether a single instance can be reused for every call. Set this to False if the transform
+    # keeps state on self between calls.
+    stateless = False
 
     def to_internal_value(self, data: dict, request):
         """Operation performed on incoming data from older request versions"""
@@ -29,3 +34,40 @@ class Transform(metaclass=TransformMeta):
     def to_representation(self, data: dict, request, instance):
         """Operation performed on outgoing data in response to an older request version"""
         raise NotImplementedError
+
+    @classmethod
+    def get_representation_operations(cls) -> Optional[list[tuple]]:
+        """
+        Declarative transforms describe what to_representation does as a list of operations on
+        the data dict, e.g. ("pop", "field_name"), so that a chain of them can be compiled into a
+        single function (see drf_versioning.transforms.compiler). None means the transform has to
+        be called.
+        """
+        return None
+
+    @classmethod
+    def get_internal_value_operations(cls) -> Optional[list[tuple]]:
+        """Like get_representation_operations, for to_internal_value."""
+        return None
+
+    def to_representation_batch(self, data: list[dict], request, instances: list):
+        """
+        Operation performed on a whole page of outgoing data (e.g. when serializing with
+        many=True) in response to an older request version. data[i] is the representation of
+        instances[i].
+
+        By default this calls to_representation for each item. Override it to do the work once per
+        page, e.g. to bulk-fetch related data instead of querying once per instance.
+        """
+        for item, instance in zip(data, instances):
+            self.to_representation(item, request, instance)
+        return data
+
+
+def is_unmodified(transform: type[Transform], base: type[Transform]) -> bool:
+    """Whether `transform` is a subclass of `base` which doesn't override how data is
+    transformed."""
+    return issubclass(transform, base) and all(
+        getattr(transform, method) is getattr(base, method)
+        for method in ("to_representation", "to_representation_batch", "to_internal_value")
+    )
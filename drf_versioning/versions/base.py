@@ -1,4 +1,5 @@
-from typing import Type, Union, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, Sequence, Type, Union, TYPE_CHECKING
 
 from packaging.version import Version as _Version, InvalidVersion
 
@@ -10,12 +11,19 @@ if TYPE_CHECKING:
 
 
 class Version(_Version):
-    notes: list[str]
-    transforms: list[Type["Transform"]]
-    viewsets_introduced: list
-    viewsets_removed: list
-    view_methods_introduced: list
-    view_methods_removed: list
+    # These are lists until the registry is frozen (see drf_versioning.registry.freeze), and
+    # tuples afterwards.
+    notes: Sequence[str]
+    transforms: Sequence[Type["Transform"]]
+    viewsets_introduced: Sequence
+    viewsets_removed: Sequence
+    view_methods_introduced: Sequence
+    view_methods_removed: Sequence
+
+    # Set when the Version is added to a VersionRegistry. Versions from the same registry compare
+    # by ordinal instead of by their full version key.
+    _registry: Optional["VersionRegistry"] = None
+    _ordinal: Optional[int] = None
 
     def __init__(
         self,
@@ -30,24 +38,52 @@ class Version(_Version):
         self.view_methods_removed = []
         super().__init__(version)
 
+    def register(self, attribute: str, obj) -> None:
+        """Add obj to one of the registration lists (e.g. "transforms"). Once the registry is
+        frozen they are tuples, so things registered later (e.g. classes defined at runtime) are
+        added to a new tuple."""
+        registered = getattr(self, attribute)
+        if isinstance(registered, tuple):
+            setattr(self, attribute, registered + (obj,))
+        else:
+            registered.append(obj)
+
     @classmethod
     def list(cls):
         return versioning_settings.VERSION_LIST
 
     @classmethod
-    def get(cls, version_str: str):
+    def registry(cls) -> "VersionRegistry":
+        """The index of the current VERSION_LIST. It is rebuilt whenever the list is replaced."""
+        global _registry
+        versions = cls.list()
+        if _registry is None or _registry.source is not versions:
+            _registry = VersionRegistry(versions)
+        return _registry
+
+    @classmethod
+    def get(cls, version_str: Union[str, "Version"]):
+        """Return the canonical Version instance from the VERSION_LIST which matches
+        version_str."""
+        registry = cls.registry()
         try:
-            return next(v for v in cls.list() if v == version_str)
-        except StopIteration:
+            return registry.lookup[version_str]
+        except (KeyError, TypeError):
+            pass
+        version = registry.versions.get(cls.parse(version_str))
+        if version is None:
             raise VersionDoesNotExist(version_str)
+        if isinstance(version_str, str) and len(registry.lookup) < registry.MAX_LOOKUP_SIZE:
+            registry.lookup[version_str] = version
+        return version
 
     @classmethod
     def get_latest(cls):
-        return max(cls.list())
+        return cls.registry().latest
 
     @classmethod
     def get_earliest(cls):
-        return min(cls.list())
+        return cls.registry().earliest
 
     @classmethod
     def get_default(cls):
@@ -73,17 +109,86 @@ class Version(_Version):
         else:
             raise InvalidVersion(str(other))
 
+    def _coerce(self, other: Union[str, _Version]) -> _Version:
+        """Resolve the other side of a comparison. Strings are looked up in the registry (or a
+        parse cache) instead of being parsed into a new Version every time."""
+        if isinstance(other, _Version):
+            return other
+        if isinstance(other, str):
+            if self._registry is not None:
+                version = self._registry.lookup.get(other)
+                if version is not None:
+                    return version
+            return _parse_str(self.__class__, other)
+        return self.parse(other)
+
     def __lt__(self, other: Union[str, "Version"]) -> bool:
-        return super().__lt__(self.parse(other))
+        other = self._coerce(other)
+        if self._registry is not None and self._registry is getattr(other, "_registry", None):
+            return self._ordinal < other._ordinal
+        return super().__lt__(other)
 
     def __le__(self, other: Union[str, "Version"]) -> bool:
-        return super().__le__(self.parse(other))
+        other = self._coerce(other)
+        if self._registry is not None and self._registry is getattr(other, "_registry", None):
+            return self._ordinal <= other._ordinal
+        return super().__le__(other)
 
     def __eq__(self, other: Union[str, "Version"]) -> bool:
-        return super().__eq__(self.parse(other))
+        other = self._coerce(other)
+        if self._registry is not None and self._registry is getattr(other, "_registry", None):
+            return self._ordinal == other._ordinal
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        # Overriding __eq__ removes the inherited __hash__, so we need to restore it explicitly.
+        # Equal versions (e.g. "2.0" and "2.0.0") hash the same.
+        return super().__hash__()
 
     def __ge__(self, other: Union[str, "Version"]) -> bool:
-        return super().__ge__(self.parse(other))
+        other = self._coerce(other)
+        if self._registry is not None and self._registry is getattr(other, "_registry", None):
+            return self._ordinal >= other._ordinal
+        return super().__ge__(other)
 
     def __gt__(self, other: Union[str, "Version"]) -> bool:
-        return super().__gt__(self.parse(other))
+        other = self._coerce(other)
+        if self._registry is not None and self._registry is getattr(other, "_registry", None):
+            return self._ordinal > other._ordinal
+        return super().__gt__(other)
+
+
+@lru_cache(maxsize=256)
+def _parse_str(version_class: Type[Version], version_str: str) -> _Version:
+    return version_class.parse(version_str)
+
+
+class VersionRegistry:
+    """
+    Maps every version in a VERSION_LIST to its canonical Version instance, so that lookups are a
+    dict access instead of a scan over the list.
+
+    Building the registry freezes the version order: each version is assigned an integer ordinal,
+    so that comparisons between registered versions are int comparisons.
+    """
+
+    MAX_LOOKUP_SIZE = 1024  # bounds the cache of raw version strings
+
+    def __init__(self, versions):
+        self.source = versions
+        self.versions: dict[Version, Version] = {}
+        self.lookup: dict[str, Version] = {}  # raw version string -> canonical Version
+        for version in versions:
+            self.versions.setdefault(version, version)  # the first occurrence is canonical
+            self.lookup.setdefault(str(version), self.versions[version])
+        self.ordered: tuple[Version, ...] = tuple(sorted(self.versions))
+        for ordinal, version in enumerate(self.ordered):
+            version._ordinal = ordinal
+        for version in versions:
+            version._ordinal = self.versions[version]._ordinal
+            version._registry = self
+        self.latest: Optional[Version] = self.ordered[-1] if self.ordered else None
+        self.earliest: Optional[Version] = self.ordered[0] if self.ordered else None
+
+
+_registry: Optional[VersionRegistry] = None
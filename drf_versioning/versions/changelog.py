@@ -0,0 +1,72 @@
+import hashlib
+from bisect import bisect_right
+from typing import Optional
+
+from rest_framework.renderers import JSONRenderer
+
+from drf_versioning.settings import versioning_settings, versioning_settings_changed
+from .serializers import VersionSerializer
+
+Version = versioning_settings.VERSION_MODEL
+
+
+class Changelog:
+    """
+    The serialized VERSION_LIST, serialized and rendered to JSON once. The list of versions is
+    served newest first, optionally only those newer than a given version.
+
+    Each rendering is returned as (data, content, etag), where content is the JSON bytes and etag
+    is a strong ETag for them.
+    """
+
+    def __init__(self, versions):
+        self.versions = tuple(sorted(versions))  # oldest first, for bisecting
+        self.data = list(VersionSerializer(self.versions, many=True).data)
+        renderer = JSONRenderer()
+        self.fragments = [renderer.render(item) for item in self.data]
+        self.versions_rendered = {
+            version: (item, fragment, make_etag(fragment))
+            for version, item, fragment in zip(self.versions, self.data, self.fragments)
+        }
+        self.lists_rendered = {}  # index of the oldest version in the list -> rendering
+
+    def render_list(self, since: Optional[Version] = None) -> tuple:
+        """The versions newer than since (or all of them), newest first."""
+        start = 0 if since is None else bisect_right(self.versions, since)
+        try:
+            return self.lists_rendered[start]
+        except KeyError:
+            data = self.data[start:][::-1]
+            content = b"[" + b",".join(self.fragments[start:][::-1]) + b"]"
+            rendered = self.lists_rendered[start] = (data, content, make_etag(content))
+            return rendered
+
+    def render_version(self, version: Version) -> tuple:
+        try:
+            return self.versions_rendered[version]
+        except KeyError:
+            return self.versions_rendered[Version.get(version)]
+
+
+def make_etag(content: bytes) -> str:
+    return f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+
+
+_changelog: Optional[Changelog] = None
+
+
+def get_changelog() -> Changelog:
+    """The Changelog of the VERSION_LIST. It's built on first use (or by
+    drf_versioning.registry.freeze), after which the versions are assumed not to change."""
+    global _changelog
+    if _changelog is None:
+        _changelog = Changelog(versioning_settings.VERSION_LIST)
+    return _changelog
+
+
+def clear_changelog(*args, **kwargs):
+    global _changelog
+    _changelog = None
+
+
+versioning_settings_changed.connect(clear_changelog)
@@ -1,19 +1,91 @@
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+from packaging.version import InvalidVersion
 from rest_framework import viewsets, mixins, decorators
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 from drf_versioning.settings import versioning_settings
 from ..versions.serializers import VersionSerializer
+from .changelog import get_changelog
 
 Version = versioning_settings.VERSION_MODEL
 
 
+class PrerenderedResponse(Response):
+    """A Response whose data has already been rendered to JSON by a JSONRenderer without
+    indentation, so that the content can be sent as is."""
+
+    def __init__(self, data=None, content: bytes = b"", **kwargs):
+        super().__init__(data=data, **kwargs)
+        self.prerendered_content = content
+
+    @property
+    def rendered_content(self):
+        # as Response.rendered_content does
+        renderer = self.accepted_renderer
+        content_type = self.content_type
+        if content_type is None and renderer.charset is not None:
+            content_type = f"{renderer.media_type}; charset={renderer.charset}"
+        elif content_type is None:
+            content_type = renderer.media_type
+        self["Content-Type"] = content_type
+        return self.prerendered_content
+
+
 class VersionViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
-    """Serializes all the Versions in the VERSION_LIST."""
+    """
+    Serializes all the Versions in the VERSION_LIST. The responses are rendered once (see
+    Changelog), and served with an ETag and a Cache-Control max-age of cache_max_age seconds.
+
+    The list can be filtered to the versions newer than a version with ?since=<version>.
+    """
 
     serializer_class = VersionSerializer
     queryset = tuple(sorted(versioning_settings.VERSION_LIST, reverse=True))
+    cache_max_age = 60 * 60
+
+    def list(self, request, *args, **kwargs):
+        since = request.query_params.get("since")
+        if since is not None:
+            try:
+                since = Version(since)
+            except InvalidVersion as e:
+                raise ValidationError({"since": str(e)})
+        return self.get_rendered_response(request, *get_changelog().render_list(since))
 
     @decorators.action(methods=["GET"], detail=False)
     def my_version(self, request, *args, **kwargs):
-        version = Version.get(request.version)
-        return Response(data=self.get_serializer(instance=version).data, status=200)
+        rendered = get_changelog().render_version(request.version)
+        response = self.get_rendered_response(request, *rendered)
+        # the response depends on the request version, wherever the versioning scheme reads it from
+        scheme = getattr(request, "versioning_scheme", None)
+        if vary_headers := getattr(scheme, "vary_headers", None):
+            patch_vary_headers(response, vary_headers)
+        return response
+
+    def get_rendered_response(self, request, data, content: bytes, etag: str):
+        """
+        The prerendered content, with its ETag, if it's what the client asked for. Other
+        renderings (e.g. indented JSON, or the browsable API) are rendered as usual, and get no
+        ETag, because it only identifies the prerendered content.
+        """
+        if self.can_use_prerendered_content(request):
+            if etag in parse_etags(request.headers.get("If-None-Match", "")):
+                response = HttpResponseNotModified()
+            else:
+                response = PrerenderedResponse(data=data, content=content, status=200)
+            response["ETag"] = etag
+        else:
+            response = Response(data=data, status=200)
+        patch_cache_control(response, public=True, max_age=self.cache_max_age)
+        return response
+
+    def can_use_prerendered_content(self, request) -> bool:
+        renderer = request.accepted_renderer
+        if type(renderer) is not JSONRenderer:
+            return False
+        indent = renderer.get_indent(request.accepted_media_type, self.get_renderer_context())
+        return not indent
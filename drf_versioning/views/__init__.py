@@ -1 +1,2 @@
 from .versioned_viewset import VersionedViewSet
+from .mixins import StreamingListModelMixin
@@ -0,0 +1,61 @@
+from itertools import islice
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework import mixins
+from rest_framework.renderers import JSONRenderer
+
+from ..renderers import RESULTS_PLACEHOLDER, StreamingJSONRenderer
+
+
+class StreamingListModelMixin(mixins.ListModelMixin):
+    """
+    Streams the list response instead of building it in memory all at once. The queryset is
+    iterated in chunks of stream_chunk_size objects, and each chunk is serialized (and
+    transformed for the request version) and rendered before the next one is loaded.
+
+    Streaming is used when the accepted renderer has a render_stream method, or is a
+    JSONRenderer; otherwise the list is rendered as usual. When pagination is enabled, the page is
+    streamed inside the paginator's usual envelope.
+
+    Because the response headers are sent before the data is serialized, an error during
+    serialization can't change the response status, and just cuts the response short.
+    """
+
+    stream_chunk_size = 1000
+
+    def list(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        if hasattr(renderer, "render_stream"):
+            render_stream = renderer.render_stream
+        elif isinstance(renderer, JSONRenderer):
+            # any JSONRenderer's output can be chunked the same way
+            render_stream = StreamingJSONRenderer.render_stream.__get__(renderer)
+        else:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        envelope = None
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            queryset = page
+            envelope = self.get_paginated_response(RESULTS_PLACEHOLDER).data
+
+        content = render_stream(
+            self.get_serialized_chunks(queryset),
+            envelope,
+            request.accepted_media_type,
+            self.get_renderer_context(),
+        )
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        return StreamingHttpResponse(content, content_type=content_type)
+
+    def get_serialized_chunks(self, objects):
+        """Yields the serialized data for objects, stream_chunk_size objects at a time."""
+        if isinstance(objects, QuerySet):
+            objects = objects.iterator(chunk_size=self.stream_chunk_size)
+        objects = iter(objects)
+        while chunk := list(islice(objects, self.stream_chunk_size)):
+            yield self.get_serializer(chunk, many=True).data
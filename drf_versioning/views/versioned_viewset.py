@@ -1,12 +1,33 @@
+import hashlib
 from typing import Optional
 
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Model, QuerySet
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from rest_framework import viewsets
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
 
-from ..decorators import versioned_view
+from ..cache import connect_invalidation, get_generation, make_key
+from ..decorators.utils import get_version_window
 from ..exceptions import VersionsNotDeclaredError
+from ..serializers import VersionedSerializer
+from ..serializers.queryset_plan import get_queryset_plan
 from ..versions import Version
 
 
+class EarlyResponse(Exception):
+    """Raised in VersionedViewSet.initial to respond without calling the handler (e.g. from the
+    cache)."""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
 class VersionedViewSetMeta(type):
     """Detect if the introduced_in / removed_in class attributes have been set on a
     VersionedViewSet subclass, and register it with the Version instance if necessary."""
@@ -26,22 +47,193 @@ class VersionedViewSetMeta(type):
         # if introduced_in and/or removed_in are declared, add the reverse relationship on the
         # Version instance.
         if removed_in_version:
-            removed_in_version.viewsets_removed.append(subclass)
+            removed_in_version.register("viewsets_removed", subclass)
         if introduced_in_version:
-            introduced_in_version.viewsets_introduced.append(subclass)
+            introduced_in_version.register("viewsets_introduced", subclass)
+
+        # Work out the [min_version, max_version) window of the viewset, and of each method
+        # decorated with versioned_view, now, so that it doesn't need to be done per request.
+        subclass.version_window = (introduced_in_version, removed_in_version)
+        subclass.version_windows = {}
+        for method_name, view in cls.get_versioned_views(subclass).items():
+            window = view.version_windows[subclass] = get_version_window(view, subclass)
+            subclass.version_windows[method_name] = window
+
+        if subclass.cache_timeout is not None:
+            connect_invalidation(subclass.get_cache_model(), subclass.cache_alias)
         return subclass
 
+    @staticmethod
+    def get_versioned_views(viewset_class) -> dict:
+        """Find the methods on viewset_class (including inherited ones) which were decorated with
+        versioned_view, by name."""
+        views = {}
+        for klass in reversed(viewset_class.__mro__):
+            for name, value in vars(klass).items():
+                if hasattr(value, "version_windows"):
+                    views[name] = value
+                else:
+                    views.pop(name, None)
+        return views
+
 
 class VersionedViewSet(viewsets.GenericViewSet, metaclass=VersionedViewSetMeta):
     introduced_in: Optional[Version] = None
     removed_in: Optional[Version] = None
 
-    def dispatch(self, request, *args, **kwargs):
-        request_method = request.method.lower()
-        if request_method in self.http_method_names:
-            handler = getattr(self, request_method, self.http_method_not_allowed)
-            handler = versioned_view(
-                handler, introduced_in=self.introduced_in, removed_in=self.removed_in
+    # Set by VersionedViewSetMeta
+    version_window: tuple[Optional[Version], Optional[Version]]
+    version_windows: dict[str, tuple[Optional[Version], Optional[Version]]]
+
+    # Opt-in cache for the responses of cached_actions, for cache_timeout seconds (see
+    # get_cache_key). The cache is invalidated whenever an instance of cache_model (by default,
+    # the queryset's model) is saved or deleted.
+    cache_timeout: Optional[int] = None
+    cache_model: Optional[type[Model]] = None
+    cache_alias = "default"
+    cached_actions = ("list", "retrieve")
+
+    # Opt-in ETags for retrieve, built from the object's etag_token attribute (e.g. a last-modified
+    # timestamp, which must change whenever the representation would) rather than the response
+    # body, so that a matching If-None-Match gets a 304 before the object is serialized.
+    etag_token: Optional[str] = None
+
+    # Per request state of the above
+    _cache_key: Optional[str] = None
+    _etag: Optional[str] = None
+    _object = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        method = request.method.lower()
+        if method in self.http_method_names:
+            self.check_version(request)
+            if self.etag_token is not None and method in ("get", "head"):
+                if self.action == "retrieve":
+                    self.check_etag(request)
+            if self.cache_timeout is not None and method == "get":
+                if self.action in self.cached_actions:
+                    self.check_cache(request)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, EarlyResponse):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        scheme = getattr(request, "versioning_scheme", None)
+        if vary_headers := getattr(scheme, "vary_headers", None):
+            patch_vary_headers(response, vary_headers)
+        if self._etag is not None and response.status_code in (200, 304):
+            response["ETag"] = self._etag
+        if self._cache_key is not None:
+            if isinstance(response, Response) and response.status_code == 200:
+                response.add_post_render_callback(self.store_response)
+        return response
+
+    def check_version(self, request):
+        """Raise a 404 if the request version is outside the window in which the current action
+        (or else the viewset as a whole) is available."""
+        min_version, max_version = self.version_windows.get(self.action, self.version_window)
+        if min_version is not None and request.version < min_version:
+            raise Http404()
+        if max_version is not None and request.version >= max_version:
+            raise Http404()
+
+    @classmethod
+    def get_cache_model(cls) -> type[Model]:
+        """The model whose changes invalidate the cached responses."""
+        if cls.cache_model is not None:
+            return cls.cache_model
+        if isinstance(cls.queryset, QuerySet):
+            return cls.queryset.model
+        raise ImproperlyConfigured(
+            f"{cls.__name__} sets cache_timeout, so it needs to declare the cache_model (or a "
+            f"queryset) whose changes invalidate the cache."
+        )
+
+    def get_cache_key(self, request) -> str:
+        """
+        Responses are cached per action, URL kwargs, query parameters, request version and
+        media type. The user isn't part of the key, and cached responses skip the handler (and so
+        any object permission checks), so only cache responses which are the same for everyone
+        who is allowed to see them, or override this to add what they depend on.
+        """
+        return make_key(
+            self.__class__.__module__,
+            self.__class__.__qualname__,
+            self.action,
+            sorted(self.kwargs.items()),
+            sorted(request.query_params.lists()),
+            str(request.version),
+            request.accepted_media_type,
+            get_generation(self.get_cache_model(), self.cache_alias),
+        )
+
+    def check_cache(self, request):
+        """Respond from the cache if possible. Otherwise, the response is stored once rendered
+        (see finalize_response)."""
+        key = self.get_cache_key(request)
+        if (cached := caches[self.cache_alias].get(key)) is not None:
+            status_code, content_type, content = cached
+            raise EarlyResponse(
+                HttpResponse(content, status=status_code, content_type=content_type)
             )
-            setattr(self, request_method, handler)
-        return super().dispatch(request, *args, **kwargs)
+        self._cache_key = key
+
+    def store_response(self, response):
+        value = (response.status_code, response["Content-Type"], response.content)
+        caches[self.cache_alias].set(self._cache_key, value, self.cache_timeout)
+
+    def get_etag(self, request, instance) -> str:
+        serializer_class = self.get_serializer_class()
+        if issubclass(serializer_class, VersionedSerializer):
+            fingerprint = serializer_class.get_plan_fingerprint(request.version)
+        else:
+            fingerprint = serializer_class.__qualname__
+        parts = (
+            instance.pk,
+            getattr(instance, self.etag_token),
+            str(request.version),
+            request.accepted_media_type,
+            fingerprint,
+        )
+        return f'W/"{hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()}"'
+
+    def check_etag(self, request):
+        """Respond 304 Not Modified if the client has the current version of the object. The ETag
+        is added to the response in finalize_response."""
+        instance = self.get_object()
+        self._etag = self.get_etag(request, instance)
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if self._etag in if_none_match or "*" in if_none_match:
+            raise EarlyResponse(HttpResponseNotModified())
+        # the handler will want the object too, so don't query for it again
+        self._object = instance
+
+    def get_object(self):
+        if self._object is not None:
+            return self._object
+        return super().get_object()
+
+    def get_queryset(self):
+        """
+        For read requests, only load the data that the request version will actually see: the
+        queryset lookups declared on AddField transforms are applied only for versions that have
+        the field, and the columns they declare in AddField.defer are deferred for versions that
+        don't.
+        """
+        queryset = super().get_queryset()
+        request_version = getattr(self.request, "version", None)
+        if (
+            request_version
+            and self.request.method in SAFE_METHODS
+            and isinstance(queryset, QuerySet)
+        ):
+            serializer_class = self.get_serializer_class()
+            if issubclass(serializer_class, VersionedSerializer):
+                plan = get_queryset_plan(serializer_class, request_version, queryset.model)
+                keep = (self.etag_token,) if self.etag_token is not None else ()
+                queryset = plan.apply(queryset, keep=keep)
+        return queryset
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tests', '0008_alter_person_birthday'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThingPayload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('data', models.JSONField()),
+                ('version', models.CharField(max_length=20)),
+            ],
+        ),
+    ]
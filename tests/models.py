@@ -27,3 +27,10 @@ class Person(models.Model):
     @property
     def children(self):
         return self.mothered_children.all() or self.fathered_children.all()
+
+
+class ThingPayload(models.Model):
+    """A Thing payload, stored as it was submitted"""
+
+    data = models.JSONField()
+    version = models.CharField(max_length=20)
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from rest_framework.test import APIClient, APIRequestFactory
+
+from drf_versioning.versions import Version
+
+MOCK_VERSION_LIST = [
+    Version("4.2.0"),
+    Version("6.9"),
+]
+
+
+@dataclass
+class MockRequest:
+    """Stands in for a request which the versioning class has set the version of."""
+
+    version: Version
+
+
+def call_viewset(
+    viewset_class,
+    version,
+    action: str = "list",
+    pk: Optional[int] = None,
+    method: str = "get",
+    path: str = "/",
+    media_type: str = "application/json",
+    **headers,
+):
+    """Make a request for the version (in the Accept header) to the action of the viewset, and
+    render the response, unless it's already rendered (e.g. cached) or streamed."""
+    factory_method = getattr(APIRequestFactory(), method)
+    request = factory_method(path, HTTP_ACCEPT=f"{media_type}; version={version}", **headers)
+    kwargs = {} if pk is None else {"pk": pk}
+    response = viewset_class.as_view(actions={"get": action})(request, **kwargs)
+    if hasattr(response, "render"):
+        response.render()
+    return response
+
+
+def client_get(url: str, version="2.0.0", media_type: str = "application/json", **headers):
+    """Like call_viewset, but through the URLconf."""
+    return APIClient().get(url, HTTP_ACCEPT=f"{media_type}; version={version}", **headers)
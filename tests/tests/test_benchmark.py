@@ -0,0 +1,56 @@
+"""
+Benchmark of the overhead of VersionedSerializer over plain DRF for latest-version requests. It's
+skipped unless DRF_VERSIONING_BENCHMARK is set, because timings depend on the machine and its load:
+
+    DRF_VERSIONING_BENCHMARK=1 pytest tests/tests/test_benchmark.py -s
+"""
+
+import os
+import timeit
+
+import pytest
+from django.utils import timezone
+from rest_framework import serializers
+
+from drf_versioning.versions import Version
+from tests.models import Thing
+from tests.serializers import ThingSerializer
+from tests.tests.mocks import MockRequest
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DRF_VERSIONING_BENCHMARK"), reason="set DRF_VERSIONING_BENCHMARK to run"
+)
+
+N_INSTANCES = 1000
+ROUNDS = 200
+MAX_OVERHEAD = 0.01
+
+
+class PlainThingSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Thing
+        fields = ThingSerializer.Meta.fields
+
+
+def test_latest_version_overhead():
+    now = timezone.now()
+    instances = [
+        Thing(id=ii, name=f"thing {ii}", number=ii, status="OK", date_updated=now)
+        for ii in range(N_INSTANCES)
+    ]
+    request = MockRequest(Version.get_latest())
+
+    def serialize(serializer_class):
+        return serializer_class(instances, many=True, context={"request": request}).data
+
+    assert serialize(ThingSerializer) == serialize(PlainThingSerializer)  # also warms up caches
+    # alternate the measurements, so that both suffer from the same background noise, and take
+    # the best of each
+    plain, versioned = [], []
+    for _ in range(ROUNDS):
+        plain.append(timeit.timeit(lambda: serialize(PlainThingSerializer), number=1))
+        versioned.append(timeit.timeit(lambda: serialize(ThingSerializer), number=1))
+
+    overhead = min(versioned) / min(plain) - 1
+    print(f"\nplain: {min(plain):.4f}s, versioned: {min(versioned):.4f}s, overhead: {overhead:.2%}")
+    assert overhead < MAX_OVERHEAD
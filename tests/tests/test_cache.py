@@ -0,0 +1,163 @@
+from functools import partial
+
+import pytest
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete, post_save
+from rest_framework import viewsets
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from drf_versioning import cache as versioning_cache
+from drf_versioning.middleware import HostNameVersioning, URLPathVersioning
+from drf_versioning.views import VersionedViewSet
+from tests import versions
+from tests.models import Thing
+from tests.serializers import ThingSerializer
+from tests.tests.mocks import call_viewset
+
+pytestmark = pytest.mark.django_db
+
+
+class CachedThingViewSet(VersionedViewSet, viewsets.ModelViewSet):
+    serializer_class = ThingSerializer
+    queryset = Thing.objects.order_by("id")
+    introduced_in = versions.VERSION_1_0_0
+    cache_timeout = 60
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    caches["default"].clear()
+    yield
+    caches["default"].clear()
+
+
+get = partial(call_viewset, CachedThingViewSet)
+
+
+@pytest.fixture
+def thing():
+    return Thing.objects.create(id=1, name="foo", number=1)
+
+
+def test_responses_are_cached_per_version(thing, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        first = get("2.1.0")
+    with django_assert_num_queries(0):
+        second = get("2.1.0")
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second["Content-Type"] == first["Content-Type"]
+    assert b'"number"' in first.content
+
+    # another version isn't served the same response
+    other = get("2.0.0")
+    assert b'"number"' not in other.content
+
+
+def test_handler_is_not_wrapped(thing):
+    response = get("2.1.0")
+    view = response.renderer_context["view"]
+    assert view.get == view.list
+
+
+def test_cache_model_must_be_known():
+    with pytest.raises(ImproperlyConfigured):
+
+        class NoModelViewSet(VersionedViewSet, viewsets.ModelViewSet):
+            serializer_class = ThingSerializer
+            introduced_in = versions.VERSION_1_0_0
+            cache_timeout = 60
+
+            def get_queryset(self):
+                return Thing.objects.all()
+
+    class CacheModelViewSet(VersionedViewSet, viewsets.ModelViewSet):
+        serializer_class = ThingSerializer
+        introduced_in = versions.VERSION_1_0_0
+        cache_timeout = 60
+        cache_model = Thing
+
+        def get_queryset(self):
+            return Thing.objects.all()
+
+    assert CacheModelViewSet.get_cache_model() is Thing
+
+
+def test_invalidation_errors_are_logged(caplog):
+    versioning_cache.connect_invalidation(Thing, "nonexistent")
+    try:
+        Thing.objects.create(id=1, name="foo", number=1)
+    finally:
+        dispatch_uid = f"{versioning_cache.KEY_PREFIX}:nonexistent:tests.thing"
+        post_save.disconnect(sender=Thing, dispatch_uid=dispatch_uid)
+        post_delete.disconnect(sender=Thing, dispatch_uid=dispatch_uid)
+    assert "Could not invalidate the cached data of tests.Thing" in caplog.text
+
+
+def test_cache_key_includes_lookup_and_query(thing):
+    Thing.objects.create(id=2, name="bar", number=2)
+    assert get("2.1.0", "retrieve", pk=1).data["name"] == "foo"
+    assert b'"bar"' in get("2.1.0", "retrieve", pk=2).content
+    assert get("2.1.0", path="/?page=1").content == get("2.1.0").content
+    # distinct entries: list, list?page=1, retrieve 1 and retrieve 2
+    assert len(caches["default"]._cache) == 4 + 1  # and the generation
+
+
+@pytest.mark.parametrize("change", ["save", "delete"])
+def test_saving_or_deleting_invalidates(thing, change):
+    assert b'"foo"' in get("2.1.0").content
+    if change == "save":
+        thing.name = "changed"
+        thing.save()
+        assert b'"changed"' in get("2.1.0").content
+    else:
+        thing.delete()
+        assert get("2.1.0").content == b"[]"
+
+
+def test_errors_are_not_cached(thing):
+    assert get("2.1.0", "retrieve", pk=2).status_code == 404
+    Thing.objects.bulk_create([Thing(id=2, name="bar")])  # no signals
+    assert get("2.1.0", "retrieve", pk=2).status_code == 200
+
+
+def test_uncached_viewset_by_default(thing, django_assert_num_queries):
+    class UncachedThingViewSet(CachedThingViewSet):
+        cache_timeout = None
+
+    call_viewset(UncachedThingViewSet, "2.1.0")
+    with django_assert_num_queries(1):
+        call_viewset(UncachedThingViewSet, "2.1.0")
+
+
+@pytest.mark.parametrize(
+    "versioning_class, expected_vary",
+    [
+        (None, "Accept"),  # the default AcceptHeaderVersioning
+        (HostNameVersioning, "Host"),
+        (URLPathVersioning, None),
+    ],
+)
+def test_vary_header(versioning_class, expected_vary):
+    class ThingViewSet(CachedThingViewSet):
+        cache_timeout = None
+        renderer_classes = [JSONRenderer]  # with more than one, DRF adds Vary: Accept anyway
+
+    if versioning_class:
+        ThingViewSet.versioning_class = versioning_class
+    factory = APIRequestFactory()
+    request = factory.get("/", HTTP_ACCEPT="application/json; version=2.1.0")
+    response = ThingViewSet.as_view(actions={"get": "list"})(request, version="2.1.0")
+    assert response.get("Vary") == expected_vary
+
+
+def test_generation_survives_eviction():
+    cache = caches["default"]
+    first = versioning_cache.get_generation(Thing, "default")
+    versioning_cache.invalidate(Thing, "default")
+    assert versioning_cache.get_generation(Thing, "default") == first + 1
+    cache.clear()
+    assert versioning_cache.get_generation(Thing, "default") not in (first, first + 1)
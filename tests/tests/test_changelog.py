@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from drf_versioning.middleware import AcceptHeaderVersioning, HostNameVersioning
+from drf_versioning.settings import versioning_settings
+from drf_versioning.versions.changelog import clear_changelog, get_changelog
+from drf_versioning.versions.serializers import VersionSerializer
+from drf_versioning.versions.views import VersionViewSet
+from tests import versions
+from tests.tests.mocks import client_get
+
+
+@pytest.fixture(autouse=True)
+def fresh_changelog():
+    clear_changelog()
+    yield
+    clear_changelog()
+
+
+def test_list_is_prerendered():
+    response = client_get("/version/")
+    assert response.status_code == 200
+    expected = VersionSerializer(
+        sorted(versioning_settings.VERSION_LIST, reverse=True), many=True
+    ).data
+    assert json.loads(response.content) == expected
+    assert response.content == get_changelog().render_list()[1]
+    assert response["ETag"].startswith('"')
+    assert response["Content-Type"] == "application/json"
+    assert "max-age=3600" in response["Cache-Control"]
+    assert "public" in response["Cache-Control"]
+
+
+@pytest.mark.parametrize(
+    "since, expected_versions",
+    [
+        ("0.0.1", ["2.3.0", "2.2.0", "2.1.0", "2.0.0", "1.0.0"]),
+        ("1.0.0", ["2.3.0", "2.2.0", "2.1.0", "2.0.0"]),
+        ("2.0.5", ["2.3.0", "2.2.0", "2.1.0"]),
+        ("2.3.0", []),
+    ],
+)
+def test_list_since(since, expected_versions):
+    response = client_get(f"/version/?since={since}")
+    assert response.status_code == 200
+    assert [item["version"] for item in json.loads(response.content)] == expected_versions
+
+
+def test_list_since_invalid():
+    response = client_get("/version/?since=banana")
+    assert response.status_code == 400
+    assert "since" in response.data
+
+
+def test_list_not_modified():
+    etag = client_get("/version/")["ETag"]
+    response = client_get("/version/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert client_get("/version/?since=1.0.0", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.parametrize("version", ["1.0.0", "2.1.0"])
+def test_my_version(version):
+    response = client_get("/version/my_version/", version=version)
+    assert response.status_code == 200
+    assert json.loads(response.content)["version"] == version
+    assert response.data["version"] == version
+    assert response["ETag"] != client_get("/version/")["ETag"]
+    response = client_get(
+        "/version/my_version/", version=version, HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+    assert response.status_code == 304
+
+
+def test_changelog_is_built_once():
+    changelog = get_changelog()
+    assert get_changelog() is changelog
+    assert changelog.render_list(versions.VERSION_1_0_0) is changelog.render_list(
+        versions.VERSION_1_0_0
+    )
+
+
+@pytest.mark.parametrize(
+    "versioning_class, expected_vary",
+    [(AcceptHeaderVersioning, "Accept"), (HostNameVersioning, "Host")],
+)
+def test_my_version_varies_with_versioning_scheme(
+    versioning_class, expected_vary, monkeypatch, settings
+):
+    settings.ALLOWED_HOSTS = ["v2.example.com"]
+    monkeypatch.setattr(VersionViewSet, "versioning_class", versioning_class)
+    request = APIRequestFactory().get(
+        "/", HTTP_ACCEPT="application/json; version=2.0.0", HTTP_HOST="v2.example.com"
+    )
+    response = VersionViewSet.as_view(actions={"get": "my_version"})(request)
+    response.render()
+    assert response.status_code == 200
+    assert expected_vary in response["Vary"]
+
+
+def test_indented_list_is_rendered_as_usual():
+    response = client_get("/version/", media_type="application/json; indent=4")
+    assert response.status_code == 200
+    assert response.content.startswith(b'[\n    {\n        "version": "2.3.0"')
+    assert json.loads(response.content) == json.loads(client_get("/version/").content)
+    assert "ETag" not in response
+
+
+def test_browsable_api_gets_no_etag(settings):
+    settings.INSTALLED_APPS = [*settings.INSTALLED_APPS, "rest_framework"]
+    response = client_get("/version/", media_type="text/html")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/html")
+    assert "ETag" not in response
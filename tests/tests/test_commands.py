@@ -0,0 +1,130 @@
+import io
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from tests.models import ThingPayload
+
+LATEST_PAYLOADS = [
+    dict(id=ii, name=f"thing {ii}", number=ii, status="OK", date_updated="2022-01-01T00:00:00Z")
+    for ii in range(7)
+]
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "in.jsonl"
+    path.write_text("".join(json.dumps(payload) + "\n" for payload in LATEST_PAYLOADS) + "\n")
+    return path
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_convert_payloads_downgrade(input_file, tmp_path, workers):
+    output_file = tmp_path / "out.jsonl"
+    call_command(
+        "convert_payloads",
+        "tests.serializers.ThingSerializer",
+        str(input_file),
+        output=str(output_file),
+        to_version="2.1.0",
+        workers=workers,
+        batch_size=2,
+    )
+    lines = output_file.read_text().splitlines()
+    # in the original order, and the blank line is skipped
+    assert [json.loads(line) for line in lines] == [
+        dict(id=ii, name=f"thing {ii}", number=ii) for ii in range(7)
+    ]
+
+
+def test_convert_payloads_upgrade_to_stdout(input_file):
+    stdout = io.StringIO()
+    call_command(
+        "convert_payloads",
+        "tests.serializers.ThingSerializer",
+        str(input_file),
+        from_version="2.0.0",
+        workers=0,
+        stdout=stdout,
+    )
+    # number, status and date_updated didn't exist in 2.0.0, so they are ignored
+    assert [json.loads(line) for line in stdout.getvalue().splitlines()] == [
+        dict(id=ii, name=f"thing {ii}") for ii in range(7)
+    ]
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, message",
+    [
+        (["tests.serializers.Nope"], dict(to_version="2.0.0"), "Nope"),
+        (["tests.models.Thing"], dict(to_version="2.0.0"), "is not a VersionedSerializer"),
+        (["tests.serializers.ThingSerializer"], dict(to_version="9.9.9"), "9.9.9"),
+    ],
+)
+def test_convert_payloads_errors(args, kwargs, message):
+    with pytest.raises(CommandError, match=message):
+        call_command("convert_payloads", *args, **kwargs)
+
+
+@pytest.fixture
+def payloads():
+    return [
+        ThingPayload.objects.create(version="2.0.0", data=dict(name="a", number=1)),
+        ThingPayload.objects.create(version="2.1.0", data=dict(name="b", number=2, status="OK")),
+        ThingPayload.objects.create(version="2.3.0", data=dict(name="c", number=3, status="OK")),
+        ThingPayload.objects.create(version="6.6.6", data=dict(name="d", number=4)),
+        ThingPayload.objects.create(version="2.0.0", data=dict(name="e")),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_migrate_payloads(payloads, batch_size):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    call_command(
+        "migrate_payloads",
+        "tests.ThingPayload",
+        "tests.serializers.ThingSerializer",
+        batch_size=batch_size,
+        stdout=stdout,
+        stderr=stderr,
+    )
+    migrated = {payload.data["name"]: payload for payload in ThingPayload.objects.all()}
+    # fields which didn't exist in the payload's version are dropped
+    assert migrated["a"].data == dict(name="a")
+    assert migrated["b"].data == dict(name="b", number=2)
+    assert migrated["c"].data == dict(name="c", number=3, status="OK")  # already the latest
+    assert migrated["d"].data == dict(name="d", number=4)
+    assert migrated["e"].data == dict(name="e")
+    assert [migrated[name].version for name in "abcde"] == ["2.3.0"] * 3 + ["6.6.6", "2.3.0"]
+    assert "Migrated 3 rows to version 2.3.0" in stdout.getvalue()
+    assert "Skipped 1 rows with unknown versions" in stderr.getvalue()
+
+
+@pytest.mark.django_db
+def test_migrate_payloads_resumes_after(payloads):
+    call_command(
+        "migrate_payloads",
+        "tests.ThingPayload",
+        "tests.serializers.ThingSerializer",
+        after=payloads[1].pk,
+        stdout=io.StringIO(),
+        stderr=io.StringIO(),
+    )
+    assert ThingPayload.objects.get(pk=payloads[0].pk).version == "2.0.0"
+    assert ThingPayload.objects.get(pk=payloads[4].pk).version == "2.3.0"
+
+
+@pytest.mark.django_db
+def test_migrate_payloads_queries_per_batch(payloads, django_assert_num_queries):
+    # a select and a bulk update per batch, rather than a query per row
+    with django_assert_num_queries(2 * 3 + 1, exact=False):
+        call_command(
+            "migrate_payloads",
+            "tests.ThingPayload",
+            "tests.serializers.ThingSerializer",
+            batch_size=2,
+            stdout=io.StringIO(),
+            stderr=io.StringIO(),
+        )
@@ -0,0 +1,166 @@
+import pytest
+
+from drf_versioning.transforms import AddField, RemoveField, RenameField, Transform
+from drf_versioning.transforms.compiler import (
+    compile_internal_value,
+    compile_representation,
+    compile_representation_batch,
+)
+from drf_versioning.versions import Version
+
+
+class AddFoo(AddField):
+    field_name = "foo"
+    version = Version("2")
+
+
+class RemoveBar(RemoveField):
+    field_name = "bar"
+    version = Version("2")
+    null_value = []
+
+
+class UppercaseName(Transform):
+    version = Version("2")
+
+    def to_representation(self, data, request, instance):
+        data["name"] = data["name"].upper()
+
+    def to_internal_value(self, data, request):
+        data["name"] = data["name"].lower()
+
+
+class AddCustomFoo(AddField):
+    field_name = "foo"
+    version = Version("2")
+
+    def to_representation(self, data, request, instance):
+        data.pop(self.field_name)
+        data["had_foo"] = True
+
+
+def test_declarative_transforms_are_inlined():
+    function = compile_representation([AddFoo, RemoveBar])
+    assert "AddFoo" not in function.__source__
+    assert "data.pop('foo', None)" in function.__source__
+    assert "data['bar'] = _" in function.__source__
+
+    data = dict(name="x", foo=1)
+    function(data, None, None)
+    assert data == dict(name="x", bar=[])
+
+
+def test_constants_are_referenced_not_copied():
+    # the compiled function reuses the same null_value object, like RemoveField does
+    function = compile_representation([RemoveBar])
+    first, second = function({}, None, None), function({}, None, None)
+    assert first["bar"] is second["bar"] is RemoveBar.null_value
+
+
+def test_custom_transforms_are_called():
+    function = compile_representation([UppercaseName, AddFoo])
+    data = dict(name="x", foo=1)
+    function(data, None, None)
+    assert data == dict(name="X")
+
+
+def test_overridden_declarative_transform_is_called():
+    function = compile_representation([AddCustomFoo])
+    data = dict(foo=1)
+    function(data, None, None)
+    assert data == dict(had_foo=True)
+
+
+def test_internal_value():
+    function = compile_internal_value([UppercaseName, AddFoo, RemoveBar])
+    data = dict(name="X", bar=[1])
+    function(data, None)
+    assert data == dict(name="x")
+
+
+@pytest.mark.parametrize(
+    "transforms, n_loops",
+    [
+        ([], 0),
+        ([AddFoo, RemoveBar], 1),
+        ([AddFoo, UppercaseName, RemoveBar], 2),
+    ],
+)
+def test_batch_groups_declarative_transforms_into_loops(transforms, n_loops):
+    function = compile_representation_batch(transforms)
+    assert function.__source__.count("for item in data:") == n_loops
+
+    data = [dict(name="a", foo=1, bar=2), dict(name="b", foo=3, bar=4)]
+    expected = [dict(item) for item in data]
+    single = compile_representation(transforms)
+    for item in expected:
+        single(item, None, None)
+    function(data, None, [None, None])
+    assert data == expected
+
+
+def test_unknown_operation():
+    class Weird(Transform):
+        version = Version("2")
+
+        @classmethod
+        def get_representation_operations(cls):
+            return [("frobnicate", "foo")]
+
+    with pytest.raises(ValueError, match="Unknown transform operation"):
+        compile_representation([Weird])
+
+
+def test_chains_are_simplified():
+    class RemoveFoo(RemoveField):
+        field_name = "foo"
+        version = Version("3")
+
+    class RenameName(RenameField):
+        old_field_name = "title"
+        new_field_name = "name"
+        version = Version("3")
+
+    class RenameNameBack(RenameField):
+        old_field_name = "name"
+        new_field_name = "title"
+        version = Version("4")
+
+    # foo was added in 2 and removed in 3, and title was renamed in 3 and renamed back in 4, so
+    # all that's left is to make sure neither foo nor name are present
+    function = compile_representation([RenameNameBack, RemoveFoo, RenameName, AddFoo])
+    assert function.__source__.count("\n") == 4  # def, 2 pops, return
+    data = dict(title="x", foo=1)
+    function(data, None, None)
+    assert data == dict(title="x")
+
+
+@pytest.mark.parametrize("stateless, n_instances", [(True, 1), (False, 3)])
+def test_stateless_transforms_are_instantiated_once(stateless, n_instances):
+    instances = []
+
+    class CountingTransform(Transform):
+        version = Version("2")
+
+        def __init__(self):
+            instances.append(self)
+
+        def to_representation(self, data, request, instance):
+            data["n"] = data.get("n", 0) + 1
+
+    CountingTransform.stateless = stateless
+    function = compile_representation([CountingTransform])
+    data = {}
+    for _ in range(3):
+        function(data, None, None)
+    assert data == {"n": 3}
+    assert len(instances) == n_instances
+
+
+def test_addfield_subclasses_are_stateless_by_default():
+    class AddFooSubclass(AddFoo):
+        def to_representation(self, data, request, instance):
+            data.pop(self.field_name)
+
+    function = compile_representation([AddFooSubclass])
+    assert "().to_representation" not in function.__source__
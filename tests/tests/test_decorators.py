@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from django.http import Http404
@@ -8,6 +8,7 @@ from drf_versioning.decorators.utils import get_min_version, get_max_version
 from drf_versioning.exceptions import VersionsNotDeclaredError
 from drf_versioning.versions import Version
 from tests import versions
+from tests.views import ThingViewSet, OtherThingViewSet
 
 
 def test_versioned_view_raises_error_if_no_args_passed():
@@ -101,3 +102,30 @@ def test_versioned_view_adds_view_to_version_instance():
 
     assert func in v42.view_methods_introduced
     assert func in v69.view_methods_removed
+
+
+def test_versioned_view_window_is_precomputed_for_viewsets():
+    assert ThingViewSet.list.version_windows[ThingViewSet] == (
+        versions.VERSION_2_0_0,
+        versions.VERSION_2_2_0,
+    )
+    assert OtherThingViewSet.list.version_windows[OtherThingViewSet] == (
+        versions.VERSION_2_0_0,
+        None,
+    )
+
+
+def test_versioned_view_computes_window_once_per_viewset_class():
+    @versioned_view(introduced_in=versions.VERSION_2_0_0)
+    def mock_view(viewset, request, *args, **kwargs):
+        return 200
+
+    request = MagicMock()
+    request.version = versions.VERSION_2_1_0
+    with patch(
+        "drf_versioning.decorators.decorators.get_version_window",
+        return_value=(versions.VERSION_2_0_0, None),
+    ) as mock_get_window:
+        assert mock_view(..., request) == 200
+        assert mock_view(..., request) == 200
+    mock_get_window.assert_called_once()
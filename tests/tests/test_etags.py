@@ -0,0 +1,91 @@
+from datetime import timedelta
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+from rest_framework import viewsets
+
+from drf_versioning.views import VersionedViewSet
+from tests import versions
+from tests.models import Thing
+from tests.serializers import PersonSerializer, ThingSerializer
+from tests.tests.mocks import call_viewset
+
+pytestmark = pytest.mark.django_db
+
+
+class ETagThingViewSet(VersionedViewSet, viewsets.ReadOnlyModelViewSet):
+    serializer_class = ThingSerializer
+    queryset = Thing.objects.all()
+    introduced_in = versions.VERSION_1_0_0
+    etag_token = "date_updated"
+
+
+get = partial(call_viewset, ETagThingViewSet, action="retrieve", pk=1)
+
+
+@pytest.fixture
+def thing():
+    return Thing.objects.create(id=1, name="foo", number=1)
+
+
+def test_etag_and_not_modified(thing, django_assert_num_queries):
+    response = get("2.1.0")
+    etag = response["ETag"]
+    assert response.status_code == 200
+    assert etag.startswith('W/"')
+
+    with patch.object(ThingSerializer, "to_representation") as mock_serialize:
+        with django_assert_num_queries(1):
+            response = get("2.1.0", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert mock_serialize.call_count == 0
+
+    assert get("2.1.0", HTTP_IF_NONE_MATCH="*").status_code == 304
+    assert get("2.1.0", method="head", HTTP_IF_NONE_MATCH=etag).status_code == 304
+    assert get("2.1.0", HTTP_IF_NONE_MATCH='W/"other"').status_code == 200
+
+
+def test_etag_queries_object_once(thing, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        response = get("2.1.0")
+    view = response.renderer_context["view"]
+    assert view.get == view.retrieve  # the handler isn't wrapped
+
+
+def test_etag_depends_on_version_and_change_token(thing):
+    etag = get("2.1.0")["ETag"]
+    assert get("2.1.0")["ETag"] == etag
+    # 2.2.0 has different transforms, but 2.2.0 and 2.3.0 don't
+    assert get("2.2.0")["ETag"] != etag
+    assert get("2.2.0")["ETag"] != get("2.3.0")["ETag"]  # the version is still part of it
+
+    thing.date_updated += timedelta(seconds=1)
+    thing.save()
+    response = get("2.1.0", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_no_etag_for_errors():
+    response = get("2.1.0", pk=666)
+    assert response.status_code == 404
+    assert "ETag" not in response
+
+
+def test_no_etag_by_default(thing):
+    class ThingViewSet(ETagThingViewSet):
+        etag_token = None
+
+    assert "ETag" not in call_viewset(ThingViewSet, "2.1.0", "retrieve", pk=1)
+
+
+def test_plan_fingerprint_includes_nested_serializers():
+    # PersonSerializer and its nested serializers all add birthday in 2.3.0
+    assert PersonSerializer.get_plan_fingerprint(
+        versions.VERSION_2_2_0
+    ) != PersonSerializer.get_plan_fingerprint(versions.VERSION_2_3_0)
+    assert ThingSerializer.get_plan_fingerprint(
+        versions.VERSION_2_2_0
+    ) == ThingSerializer.get_plan_fingerprint(versions.VERSION_2_3_0)
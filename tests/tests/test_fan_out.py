@@ -0,0 +1,82 @@
+import pytest
+
+from drf_versioning.transforms import Transform
+from drf_versioning.versions import Version
+from tests import versions
+from tests.models import Person, Thing
+from tests.serializers import PersonSerializer, ThingSerializer
+from tests.tests.mocks import MockRequest
+
+pytestmark = pytest.mark.django_db
+
+ALL_VERSIONS = [
+    versions.VERSION_1_0_0,
+    versions.VERSION_2_0_0,
+    versions.VERSION_2_1_0,
+    versions.VERSION_2_2_0,
+    versions.VERSION_2_3_0,
+]
+
+
+@pytest.fixture
+def family():
+    kwargs = dict(birthday="2000-01-01")
+    dad = Person.objects.create(name="Dad", **kwargs)
+    mum = Person.objects.create(name="Mum", **kwargs)
+    child = Person.objects.create(name="Child", father=dad, mother=mum, **kwargs)
+    Person.objects.create(name="Grandchild", mother=child, **kwargs)
+    return child
+
+
+@pytest.mark.parametrize(
+    "serializer_class, get_instance",
+    [
+        (ThingSerializer, lambda family: Thing.objects.create(name="foo", number=1)),
+        (PersonSerializer, lambda family: family),
+    ],
+)
+def test_to_representations_matches_serializing_each_version(
+    family, serializer_class, get_instance
+):
+    instance = get_instance(family)
+    request = MockRequest(version=versions.VERSION_1_0_0)
+    representations = serializer_class(context={"request": request}).to_representations(
+        instance, ALL_VERSIONS
+    )
+    assert list(representations) == ALL_VERSIONS
+    for version, representation in representations.items():
+        expected = serializer_class(instance, context={"request": MockRequest(version)}).data
+        assert representation == expected
+
+
+def test_to_representations_serializes_once(family, django_assert_num_queries):
+    serializer = PersonSerializer(context={"request": None})
+    # the same queries as serializing once: children, and grandchildren (mothered_children, and
+    # then fathered_children because there are none)
+    with django_assert_num_queries(3):
+        serializer.to_representations(family, ALL_VERSIONS)
+
+
+def test_to_representations_shares_unchanged_data():
+    thing = Thing.objects.create(name="foo", number=1)
+    representations = ThingSerializer().to_representations(
+        thing, ["2.2.0", "2.3.0", versions.VERSION_2_1_0]
+    )
+    # Thing hasn't changed since 2.2.0
+    assert representations[versions.VERSION_2_2_0] is representations[versions.VERSION_2_3_0]
+    assert representations[versions.VERSION_2_1_0] == dict(id=thing.id, name="foo", number=1)
+
+
+def test_to_representations_passes_version_to_custom_transforms():
+    class RecordVersion(Transform):
+        version = Version("999")
+
+        def to_representation(self, data, request, instance):
+            data["version"] = str(request.version)
+
+    class RecordingSerializer(ThingSerializer):
+        transforms = [RecordVersion]
+
+    thing = Thing.objects.create(name="foo", number=1)
+    representations = RecordingSerializer().to_representations(thing, ["2.0.0", "2.1.0"])
+    assert [data["version"] for data in representations.values()] == ["2.0.0", "2.1.0"]
@@ -0,0 +1,123 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from drf_versioning.serializers.fragment_cache import FragmentCache, clear_fragment_caches
+from drf_versioning.versions import Version
+from tests import versions
+from tests.models import Thing
+from tests.serializers import ThingSerializer
+from tests.tests.mocks import MockRequest
+
+pytestmark = pytest.mark.django_db
+
+
+class CachedThingSerializer(ThingSerializer):
+    fragment_cache_token = "date_updated"
+
+
+class SharedCachedThingSerializer(CachedThingSerializer):
+    fragment_cache_alias = "default"
+
+
+@pytest.fixture(autouse=True)
+def clear_caches(settings):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    clear_fragment_caches()
+    caches["default"].clear()
+
+
+@pytest.fixture
+def things():
+    return [Thing.objects.create(id=ii, name=f"thing {ii}", number=ii) for ii in range(3)]
+
+
+def serialize(serializer_class, instance, version, **kwargs):
+    request = MockRequest(version=version)
+    return serializer_class(instance, context={"request": request}, **kwargs).data
+
+
+def count_serializations(serializer_class):
+    return patch.object(
+        serializer_class,
+        "to_latest_representation",
+        autospec=True,
+        side_effect=serializer_class.to_latest_representation,
+    )
+
+
+@pytest.mark.parametrize("serializer_class", [CachedThingSerializer, SharedCachedThingSerializer])
+def test_list_only_serializes_misses(things, serializer_class):
+    queryset = Thing.objects.order_by("id")
+    serialize(serializer_class, things[1], versions.VERSION_2_1_0)
+    with count_serializations(serializer_class) as mock:
+        data = serialize(serializer_class, queryset, versions.VERSION_2_1_0, many=True)
+    assert mock.call_count == 2
+    assert data == serialize(ThingSerializer, queryset, versions.VERSION_2_1_0, many=True)
+
+    with count_serializations(serializer_class) as mock:
+        assert serialize(serializer_class, queryset, versions.VERSION_2_1_0, many=True) == data
+    assert mock.call_count == 0
+
+
+def test_versions_are_cached_separately(things):
+    v210 = serialize(CachedThingSerializer, things[0], versions.VERSION_2_1_0)
+    v200 = serialize(CachedThingSerializer, things[0], versions.VERSION_2_0_0)
+    assert "number" in v210
+    assert "number" not in v200
+
+
+def test_latest_version_is_keyed_by_its_number(things):
+    latest = Version.get_latest()
+    serializer = CachedThingSerializer(context={"request": MockRequest(version=latest)})
+    assert serializer.get_fragment_key(things[0])[-1] == str(latest)
+    assert CachedThingSerializer().get_fragment_key(things[0])[-1] == str(latest)
+
+
+def test_shared_cache_uses_default_timeout(things):
+    with patch.object(caches["default"], "set_many", wraps=caches["default"].set_many) as mock:
+        serialize(SharedCachedThingSerializer, things[0], versions.VERSION_2_1_0)
+    (_, timeout), _ = mock.call_args
+    assert timeout is DEFAULT_TIMEOUT
+
+
+def test_change_token_invalidates(things):
+    thing = things[0]
+    serialize(CachedThingSerializer, thing, versions.VERSION_2_1_0)
+    thing.name = "changed"
+    thing.date_updated += timedelta(seconds=1)
+    thing.save()
+    data = serialize(CachedThingSerializer, thing, versions.VERSION_2_1_0)
+    assert data["name"] == "changed"
+
+
+def test_cached_data_is_copied(things):
+    first = serialize(CachedThingSerializer, things[0], versions.VERSION_2_1_0)
+    first["name"] = "mutated"
+    assert serialize(CachedThingSerializer, things[0], versions.VERSION_2_1_0)["name"] == "thing 0"
+
+
+def test_shared_cache_is_used_after_restart(things):
+    serialize(SharedCachedThingSerializer, things[0], versions.VERSION_2_1_0)
+    clear_fragment_caches()  # as if in another process
+    with count_serializations(SharedCachedThingSerializer) as mock:
+        serialize(SharedCachedThingSerializer, things[0], versions.VERSION_2_1_0)
+    assert mock.call_count == 0
+
+
+def test_uncached_by_default(things):
+    serialize(ThingSerializer, things[0], versions.VERSION_2_1_0)
+    with count_serializations(ThingSerializer) as mock:
+        serialize(ThingSerializer, things[0], versions.VERSION_2_1_0)
+    assert mock.call_count == 1
+
+
+def test_fragment_cache_lru():
+    cache = FragmentCache(maxsize=2)
+    cache.set_many({"a": 1, "b": 2})
+    assert cache.get_many(["a"]) == {"a": 1}  # a is now the most recently used
+    cache.set_many({"c": 3})
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
@@ -1,36 +1,147 @@
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 import pytest
 
-from drf_versioning.middleware import GetDefaultMixin
+from drf_versioning.exceptions import VersionDoesNotExist
+from django.urls import re_path
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+
+from drf_versioning.middleware import (
+    GetDefaultMixin,
+    NamespaceVersioning,
+    QueryParameterVersioning,
+    URLPathVersioning,
+    is_latest_version,
+    resolve_version,
+)
 from drf_versioning.versions import Version
+from tests.tests.mocks import MOCK_VERSION_LIST
 
 VERSION_FUTURE = Version("999")
-MOCK_VERSION_LIST = [
-    Version("4.2.0"),
-    Version("6.9"),
-]
 
 
 @pytest.mark.parametrize(
     "super_version, expected_version",
     [
-        ("999", "999"),  # version passed in request matches version not in list
-        ("6.9", "6.9"),  # version passed in request matches public version in list
-        ("666.420", "666.420"),  # completely fictitious version
-        (None, "4.2.0"),  # no version in request -> use default
-        ("", "4.2.0"),  # no version in request -> use default
+        ("6.9", MOCK_VERSION_LIST[1]),  # version passed in request matches version in list
+        ("6.9.0", MOCK_VERSION_LIST[1]),  # equivalent spelling resolves to the same instance
+        ("4.2.0", MOCK_VERSION_LIST[0]),
+        (None, MOCK_VERSION_LIST[0]),  # no version in request -> use default
+        ("", MOCK_VERSION_LIST[0]),  # no version in request -> use default
     ],
 )
 @patch("rest_framework.versioning.BaseVersioning.determine_version")
 def test_get_default_mixin(mock, super_version, expected_version, patch_settings):
     mock.return_value = super_version
     with patch_settings(
-        VERSION_LIST="tests.tests.test_middleware.MOCK_VERSION_LIST",
+        VERSION_LIST="tests.tests.mocks.MOCK_VERSION_LIST",
         DEFAULT_VERSION="earliest",
     ):
-        version = GetDefaultMixin().determine_version(...)
+        request = MagicMock(spec=[])
+        version = GetDefaultMixin().determine_version(request)
+
+    assert version is expected_version
+    assert request.raw_version == (super_version or None)
+    assert request.is_latest_version == (version is MOCK_VERSION_LIST[-1])
+    mock.assert_called_with(request)
+
+
+@pytest.mark.parametrize(
+    "super_version",
+    [
+        "999",  # version passed in request matches version not in list
+        "666.420",  # completely fictitious version
+    ],
+)
+@patch("rest_framework.versioning.BaseVersioning.determine_version")
+def test_get_default_mixin_rejects_unknown_versions(mock, super_version, patch_settings):
+    mock.return_value = super_version
+    with patch_settings(
+        VERSION_LIST="tests.tests.mocks.MOCK_VERSION_LIST",
+        DEFAULT_VERSION="earliest",
+    ):
+        with pytest.raises(VersionDoesNotExist):
+            GetDefaultMixin().determine_version(MagicMock(spec=[]))
+
+
+def test_resolve_version_is_memoized(patch_settings):
+    with patch_settings(VERSION_LIST="tests.tests.mocks.MOCK_VERSION_LIST"):
+        resolve_version.cache_clear()
+        assert resolve_version("6.9") is MOCK_VERSION_LIST[1]
+        assert resolve_version("6.9") is MOCK_VERSION_LIST[1]
+        assert resolve_version.cache_info().hits == 1
+
+    # changing the settings clears the cache
+    assert resolve_version.cache_info().currsize == 0
+
+
+def test_namespace_versioning_versioned_viewname():
+    request = MagicMock(spec=["version"])
+    request.version = MOCK_VERSION_LIST[1]
+    assert NamespaceVersioning().get_versioned_viewname("thing-list", request) == "6.9:thing-list"
+
 
-    assert isinstance(version, str)
-    assert version == expected_version
-    mock.assert_called_with(...)
+@patch("rest_framework.versioning.NamespaceVersioning.determine_version")
+def test_namespace_versioning_uses_namespace_as_sent(mock, patch_settings):
+    mock.return_value = "6.9.0"
+    with patch_settings(VERSION_LIST="tests.tests.mocks.MOCK_VERSION_LIST"):
+        request = MagicMock(spec=[])
+        request.version = NamespaceVersioning().determine_version(request)
+
+    assert request.version is MOCK_VERSION_LIST[1]
+    viewname = NamespaceVersioning().get_versioned_viewname("thing-list", request)
+    assert viewname == "6.9.0:thing-list"
+
+
+def test_is_latest_version(patch_settings):
+    with patch_settings(VERSION_LIST="tests.tests.mocks.MOCK_VERSION_LIST"):
+        # worked out by the versioning class
+        assert is_latest_version(MagicMock(is_latest_version=True)) is True
+        # worked out on the fly
+        assert is_latest_version(MagicMock(spec=["version"], version=MOCK_VERSION_LIST[1]))
+        assert not is_latest_version(MagicMock(spec=["version"], version=MOCK_VERSION_LIST[0]))
+        assert not is_latest_version(MagicMock(spec=["version"], version="6.9"))
+        assert not is_latest_version(MagicMock(spec=[]))
+
+
+class ReverseView(APIView):
+    """Responds with the URL of itself, as reversed with the request's versioning scheme."""
+
+    url_name: str
+
+    def get(self, request, *args, **kwargs):
+        return Response({"url": reverse(self.url_name, request=request)})
+
+
+class URLPathReverseView(ReverseView):
+    versioning_class = URLPathVersioning
+    url_name = "url-path"
+
+
+class QueryParameterReverseView(ReverseView):
+    versioning_class = QueryParameterVersioning
+    url_name = "query-parameter"
+
+
+urlpatterns = [
+    re_path(r"^(?P<version>2\.0|2\.1)/thing/$", URLPathReverseView.as_view(), name="url-path"),
+    re_path(r"^thing/$", QueryParameterReverseView.as_view(), name="query-parameter"),
+]
+
+
+@pytest.mark.urls("tests.tests.test_middleware")
+@pytest.mark.parametrize(
+    "url, expected_url",
+    [
+        # non-canonical spellings of 2.0.0 and 2.1.0
+        ("/2.0/thing/", "http://testserver/2.0/thing/"),
+        ("/thing/?version=2.1", "http://testserver/thing/?version=2.1"),
+    ],
+)
+def test_reverse_with_version_as_sent(url, expected_url):
+    response = APIClient().get(url)
+    assert response.status_code == 200
+    assert response.data["url"] == expected_url
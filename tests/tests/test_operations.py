@@ -0,0 +1,104 @@
+import pytest
+
+from drf_versioning.transforms.operations import ABSENT, TEMPORARY, simplify, unread_keys
+
+NULL = []
+
+
+def apply(operations, data):
+    """Apply the operations one by one, as the transforms themselves would"""
+    data = dict(data)
+    for kind, key, *args in operations:
+        if kind == "pop":
+            data.pop(key, None)
+        elif kind == "set":
+            data[key] = args[0]
+        elif kind == "move":
+            if key in data:
+                data[args[0]] = data.pop(key)
+            else:
+                data.pop(args[0], None)
+    return data
+
+
+@pytest.mark.parametrize(
+    "operations, expected",
+    [
+        ([], []),
+        # a field added and then removed again
+        ([("set", "foo", None), ("pop", "foo")], [("pop", "foo")]),
+        ([("pop", "foo"), ("pop", "foo")], [("pop", "foo")]),
+        # a rename, and a rename back
+        ([("move", "a", "b"), ("move", "b", "a")], [("pop", "b")]),
+        ([("move", "a", "a")], []),
+        # a chain of renames
+        ([("move", "a", "b"), ("move", "b", "c")], [("move", "a", "c"), ("pop", "b")]),
+        # the old value of b has to be moved before b is overwritten
+        ([("move", "b", "c"), ("move", "a", "b")], [("move", "b", "c"), ("move", "a", "b")]),
+        # two fields swapping names
+        (
+            [("move", "a", "tmp"), ("move", "b", "a"), ("move", "tmp", "b")],
+            [
+                ("move", "a", TEMPORARY),
+                ("move", "b", "a"),
+                ("move", TEMPORARY, "b"),
+                ("pop", "tmp"),
+            ],
+        ),
+        ([("move", "a", "b"), ("set", "a", NULL)], [("move", "a", "b"), ("set", "a", NULL)]),
+    ],
+)
+def test_simplify(operations, expected):
+    assert simplify(operations) == expected
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [("set", "foo", None), ("pop", "foo"), ("set", "bar", NULL)],
+        [("move", "a", "b"), ("move", "b", "c"), ("move", "c", "a")],
+        [("move", "a", "x"), ("move", "c", "a"), ("move", "b", "c"), ("move", "x", "b")],
+        [("move", "a", "b"), ("move", "b", "a"), ("pop", "a")],
+        [("pop", "a"), ("move", "a", "b"), ("set", "a", NULL)],
+        [("move", "x", "y"), ("move", "a", "x"), ("move", "y", "a"), ("pop", "c")],
+    ],
+)
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"a": 1},
+        {"a": 1, "b": 2, "c": 3},
+        {"a": 1, "b": 2, "c": 3, "x": 4, "y": 5, "foo": 6, "other": 7},
+    ],
+)
+def test_simplify_has_the_same_effect(operations, data):
+    assert apply(simplify(operations), data) == apply(operations, data)
+
+
+def test_simplify_rotation_uses_temporary_key():
+    operations = [("move", "a", "x"), ("move", "c", "a"), ("move", "b", "c"), ("move", "x", "b")]
+    simplified = simplify(operations)
+    assert any(TEMPORARY in operation for operation in simplified)
+    assert len(simplified) == 5  # 4 moves, and popping x
+    data = {"a": 1, "b": 2, "c": 3}
+    assert apply(simplified, data) == apply(operations, data) == {"a": 3, "b": 1, "c": 2}
+
+
+def test_simplify_unknown_operation():
+    with pytest.raises(ValueError, match="Unknown transform operation"):
+        simplify([("frobnicate", "foo")])
+
+
+@pytest.mark.parametrize(
+    "operations, expected",
+    [
+        ([("pop", "foo")], {"foo"}),
+        ([("set", "foo", None)], {"foo"}),
+        ([("move", "a", "b")], {"b"}),  # the value of a is still needed; b is overwritten
+        ([("move", "a", "b"), ("move", "b", "a")], {"b"}),
+    ],
+)
+def test_unread_keys(operations, expected):
+    assert unread_keys(operations) == expected
+    assert ABSENT not in unread_keys(operations)
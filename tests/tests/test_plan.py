@@ -0,0 +1,142 @@
+import pytest
+from rest_framework import serializers
+
+from drf_versioning.serializers import VersionedSerializer
+from drf_versioning.transforms import AddField, RemoveField, Transform
+from drf_versioning.transforms.plan import (
+    TransformPlan,
+    _plans,
+    clear_transform_plans,
+    get_transform_plan,
+)
+from drf_versioning.versions import Version
+from tests import versions
+from tests.tests.mocks import MockRequest
+
+
+class AddFoo(AddField):
+    field_name = "foo"
+    version = Version("2")
+
+
+class AddBar(AddField):
+    field_name = "bar"
+    version = Version("3")
+
+
+class AddBaz(AddField):
+    field_name = "baz"
+    version = Version("3")
+
+
+class FooSerializer(VersionedSerializer):
+    transforms = [AddBar, AddFoo, AddBaz]
+
+
+def test_transform_plan_orders_each_direction():
+    plan = TransformPlan(FooSerializer.transforms, Version("1"))
+    assert plan.internal_value_transforms == (AddFoo, AddBar, AddBaz)
+    # transforms for the same version keep their declared order in both directions
+    assert plan.representation_transforms == (AddBar, AddBaz, AddFoo)
+
+
+def test_transform_plan_filters_by_version():
+    assert TransformPlan(FooSerializer.transforms, Version("2")).internal_value_transforms == (
+        AddBar,
+        AddBaz,
+    )
+    assert TransformPlan(FooSerializer.transforms, "3").internal_value_transforms == ()
+
+
+def test_get_transform_plan_is_cached_per_class_and_version():
+    plan = get_transform_plan(FooSerializer, FooSerializer.transforms, Version("1"))
+    assert get_transform_plan(FooSerializer, FooSerializer.transforms, Version("1")) is plan
+    assert get_transform_plan(FooSerializer, FooSerializer.transforms, Version("2")) is not plan
+    serializer = FooSerializer(context={"request": MockRequest(version=Version("1"))})
+    assert serializer.get_transform_plan(Version("1")) is plan
+
+
+def test_get_transform_plan_is_stored_under_the_canonical_version():
+    clear_transform_plans()
+    spellings = ["2.0.0", "2.0", Version("2.0.0"), versions.VERSION_2_0_0]
+    plans = [get_transform_plan(FooSerializer, FooSerializer.transforms, v) for v in spellings]
+    assert all(plan is plans[0] for plan in plans)
+    assert plans[0].version is versions.VERSION_2_0_0
+    assert list(_plans) == [(FooSerializer, versions.VERSION_2_0_0)]
+
+
+def test_get_transform_plan_is_invalidated_by_settings_change(patch_settings):
+    plan = get_transform_plan(FooSerializer, FooSerializer.transforms, Version("1"))
+    with patch_settings(DEFAULT_VERSION="earliest"):
+        assert get_transform_plan(FooSerializer, FooSerializer.transforms, Version("1")) is not plan
+
+
+class RemoveQux(RemoveField):
+    field_name = "qux"
+    version = Version("4")
+
+
+class CustomTransform(Transform):
+    version = Version("2.5")
+
+    def to_representation(self, data, request, instance):
+        data["foo_copy"] = data.get("foo")
+        return data
+
+
+class AddFooSubclass(AddFoo):
+    def to_representation(self, data, request, instance):
+        return data  # modified behaviour; not safe to skip
+
+
+@pytest.mark.parametrize(
+    "transforms, version, expected_skipped_fields",
+    [
+        ([AddFoo, AddBar, AddBaz], Version("1"), {"foo", "bar", "baz"}),
+        ([AddFoo, AddBar, AddBaz], Version("2"), {"bar", "baz"}),
+        # qux is overwritten with its null value, so its current value is never needed
+        ([AddFoo, AddBar, RemoveQux], Version("1"), {"foo", "bar", "qux"}),
+        # transforms newer than the custom one are fine, but older ones are not, because the
+        # custom transform could read their fields
+        ([AddFoo, AddBar, CustomTransform], Version("1"), {"bar"}),
+        ([AddFooSubclass, AddBar], Version("1"), {"bar"}),
+    ],
+)
+def test_transform_plan_skipped_fields(transforms, version, expected_skipped_fields):
+    assert TransformPlan(transforms, version).skipped_fields == expected_skipped_fields
+
+
+def test_skipped_fields_are_not_serialized():
+    class MethodFieldSerializer(VersionedSerializer):
+        name = serializers.CharField()
+        foo = serializers.SerializerMethodField()
+        transforms = [AddFoo]
+
+        def get_foo(self, obj):
+            calls.append(obj)
+            return "expensive"
+
+    calls = []
+    obj = {"name": "bar"}
+    request = MockRequest(version=Version("1"))
+    assert MethodFieldSerializer(obj, context={"request": request}).data == {"name": "bar"}
+    assert calls == []
+
+    request = MockRequest(version=Version("2"))
+    data = MethodFieldSerializer(obj, context={"request": request}).data
+    assert data == {"name": "bar", "foo": "expensive"}
+    assert calls == [obj]
+
+
+@pytest.mark.parametrize(
+    "transforms, version, expected_keys",
+    [
+        ([AddFoo, AddBar, AddBaz], Version("3"), ["id", "foo", "bar", "baz"]),
+        ([AddFoo, AddBar, AddBaz], Version("2"), ["id", "foo"]),
+        ([AddFoo, AddBar, RemoveQux], Version("1"), ["id", "baz", "qux"]),
+        ([AddFoo, CustomTransform], Version("1"), None),  # depends on the data
+    ],
+)
+def test_transform_plan_representation_keys(transforms, version, expected_keys):
+    plan = TransformPlan(transforms, version)
+    assert plan.get_representation_keys(["id", "foo", "bar", "baz"]) == expected_keys
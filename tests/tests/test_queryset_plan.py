@@ -0,0 +1,182 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Prefetch
+from rest_framework import serializers, viewsets
+from rest_framework.test import APIRequestFactory
+
+from drf_versioning.serializers import VersionedSerializer
+from drf_versioning.serializers.queryset_plan import QuerysetPlan, get_queryset_plan
+from drf_versioning.transforms import AddField
+from drf_versioning.views import VersionedViewSet
+from tests import versions, transforms
+from tests.models import Person
+from tests.serializers import GrandChildSerializer
+
+pytestmark = pytest.mark.django_db
+
+
+class PersonAddChildren(AddField):
+    field_name = "children"
+    description = "Added Person.children"
+    version = versions.VERSION_2_3_0
+    prefetch_related = ("mothered_children", "fathered_children")
+
+
+class PersonAddDeferredBirthday(transforms.PersonAddBirthday):
+    defer = ("birthday",)
+
+
+class FamilySerializer(VersionedSerializer, serializers.ModelSerializer):
+    children = GrandChildSerializer(many=True)
+    transforms = [PersonAddDeferredBirthday, PersonAddChildren]
+
+    class Meta:
+        model = Person
+        fields = ["id", "name", "birthday", "children"]
+
+
+class FamilyViewSet(VersionedViewSet, viewsets.ReadOnlyModelViewSet):
+    serializer_class = FamilySerializer
+    queryset = Person.objects.order_by("id")
+    introduced_in = versions.VERSION_1_0_0
+
+
+@pytest.mark.parametrize(
+    "version, expected_prefetch_related, expected_defer",
+    [
+        (versions.VERSION_2_2_0, (), ("birthday",)),
+        (versions.VERSION_2_3_0, ("mothered_children", "fathered_children"), ()),
+    ],
+)
+def test_queryset_plan(version, expected_prefetch_related, expected_defer):
+    plan = QuerysetPlan(FamilySerializer, version, Person)
+    assert plan.select_related == ()
+    assert plan.prefetch_related == expected_prefetch_related
+    assert plan.defer == expected_defer
+    assert get_queryset_plan(FamilySerializer, version, Person) is get_queryset_plan(
+        FamilySerializer, version, Person
+    )
+
+
+class AdultSerializer(VersionedSerializer, serializers.ModelSerializer):
+    is_adult = serializers.SerializerMethodField()
+    transforms = [transforms.PersonAddBirthday]
+
+    class Meta:
+        model = Person
+        fields = ["id", "name", "birthday", "is_adult"]
+
+    def get_is_adult(self, obj):
+        return obj.birthday is not None
+
+
+class AdultViewSet(VersionedViewSet, viewsets.ReadOnlyModelViewSet):
+    serializer_class = AdultSerializer
+    queryset = Person.objects.order_by("id")
+    introduced_in = versions.VERSION_1_0_0
+
+
+@pytest.mark.parametrize("version", ["2.2.0", "2.3.0"])
+def test_columns_are_only_deferred_when_declared(version, django_assert_num_queries):
+    """Other fields may read the columns of removed fields, so nothing is deferred by default."""
+    assert QuerysetPlan(AdultSerializer, versions.VERSION_2_2_0, Person).defer == ()
+    for ii in range(10):
+        Person.objects.create(name=f"person{ii}", birthday="2010-01-02")
+
+    request = APIRequestFactory().get("", HTTP_ACCEPT=f"application/json; version={version}")
+    view = AdultViewSet.as_view({"get": "list"})
+    with django_assert_num_queries(1):
+        response = view(request)
+        response.render()
+
+    assert response.status_code == 200
+    assert all(person["is_adult"] for person in response.data)
+
+
+@pytest.mark.parametrize(
+    "version, expected_queries, expected_first_person",
+    [
+        ("2.2.0", 1, {"id": 1, "name": "mum"}),
+        (
+            "2.3.0",
+            3,  # persons, plus one prefetch query per relation
+            {
+                "id": 1,
+                "name": "mum",
+                "birthday": "2010-01-02",
+                "children": [
+                    {"name": "kid0", "birthday": "2010-01-02"},
+                    {"name": "kid1", "birthday": "2010-01-02"},
+                ],
+            },
+        ),
+    ],
+)
+def test_versioned_viewset_plans_queryset(
+    version, expected_queries, expected_first_person, django_assert_num_queries
+):
+    mum = Person.objects.create(id=1, name="mum", birthday="2010-01-02")
+    for ii in range(2):
+        Person.objects.create(name=f"kid{ii}", mother=mum, birthday="2010-01-02")
+
+    request = APIRequestFactory().get("", HTTP_ACCEPT=f"application/json; version={version}")
+    view = FamilyViewSet.as_view({"get": "list"})
+    with django_assert_num_queries(expected_queries):
+        response = view(request)
+        response.render()
+
+    assert response.status_code == 200
+    assert len(response.data) == 3
+    assert response.data[0] == expected_first_person
+
+
+@pytest.mark.parametrize(
+    "lookups, expected_message",
+    [
+        (dict(select_related=("fathr",)), "Person has no field 'fathr'"),
+        (dict(select_related=("name",)), "'name' is not a relation"),
+        (dict(select_related=("father__fathr",)), "Person has no field 'fathr'"),
+        (dict(defer=("name__father",)), "'name__father' follows a field which is not a relation"),
+        (dict(prefetch_related=("kinder",)), "Person has no attribute 'kinder'"),
+        (dict(prefetch_related=(Prefetch("kids"),)), "Person has no attribute 'kids'"),
+    ],
+)
+def test_queryset_plan_rejects_unknown_lookups(lookups, expected_message, monkeypatch):
+    monkeypatch.setattr(versions.VERSION_2_3_0, "transforms", versions.VERSION_2_3_0.transforms)
+    typo = type(
+        "PersonAddTypo",
+        (AddField,),
+        dict(field_name="typo", description="Typo", version=versions.VERSION_2_3_0, **lookups),
+    )
+
+    class TypoSerializer(VersionedSerializer, serializers.ModelSerializer):
+        transforms = [typo]
+
+        class Meta:
+            model = Person
+            fields = ["id"]
+
+    with pytest.raises(ImproperlyConfigured, match=expected_message):
+        QuerysetPlan(TypoSerializer, versions.VERSION_2_3_0, Person)
+
+
+def test_queryset_plan_accepts_valid_lookups(monkeypatch):
+    monkeypatch.setattr(versions.VERSION_2_3_0, "transforms", versions.VERSION_2_3_0.transforms)
+
+    class PersonAddRelatives(AddField):
+        field_name = "relatives"
+        description = "Added Person.relatives"
+        version = versions.VERSION_2_3_0
+        select_related = ("father__mother",)
+        prefetch_related = (Prefetch("mothered_children__fathered_children"),)
+        defer = ("birthday", "father__name")
+
+    class RelativesSerializer(VersionedSerializer, serializers.ModelSerializer):
+        transforms = [PersonAddRelatives]
+
+        class Meta:
+            model = Person
+            fields = ["id"]
+
+    plan = QuerysetPlan(RelativesSerializer, versions.VERSION_2_3_0, Person)
+    assert plan.select_related == ("father__mother",)
@@ -0,0 +1,132 @@
+import pytest
+from django.core import checks
+from rest_framework import serializers, viewsets
+
+from drf_versioning import registry
+from drf_versioning.exceptions import VersionNotInVersionListError
+from drf_versioning.serializers import VersionedSerializer
+from drf_versioning.transforms import Transform
+from drf_versioning.transforms.plan import _plans, clear_transform_plans
+from drf_versioning.versions import changelog
+from drf_versioning.versions import Version
+from drf_versioning.views import VersionedViewSet
+from tests import transforms, versions
+from tests.models import Thing
+from tests.views import ThingViewSet
+
+
+def only_subclasses(monkeypatch, *classes):
+    """Restrict freeze to the given transforms and viewsets, so that it doesn't trip over the
+    classes other tests define."""
+    subclasses = {
+        Transform: [cls for cls in classes if issubclass(cls, Transform)],
+        VersionedViewSet: [cls for cls in classes if issubclass(cls, VersionedViewSet)],
+    }
+    monkeypatch.setattr(registry, "get_subclasses", subclasses.__getitem__)
+
+
+class AbstractThingSerializer(VersionedSerializer, serializers.ModelSerializer):
+    """Has no Meta.model, so can't be instantiated."""
+
+    transforms = [transforms.ThingTransformAddNumber]
+
+
+class ConcreteThingSerializer(AbstractThingSerializer):
+    class Meta:
+        model = Thing
+        fields = ["id", "name", "number"]
+
+
+class ConcreteThingViewSet(VersionedViewSet, viewsets.ReadOnlyModelViewSet):
+    serializer_class = ConcreteThingSerializer
+    queryset = Thing.objects.all()
+    introduced_in = versions.VERSION_1_0_0
+
+
+def test_freeze(monkeypatch):
+    only_subclasses(
+        monkeypatch,
+        transforms.ThingTransformAddNumber,
+        ThingViewSet,
+        ConcreteThingViewSet,
+    )
+    clear_transform_plans()
+    registry.freeze()
+    for version in versions.VERSIONS:
+        for attribute in registry.REGISTRATION_ATTRIBUTES:
+            assert isinstance(getattr(version, attribute), tuple)
+    assert ThingViewSet in versions.VERSION_1_0_0.viewsets_introduced
+    assert ThingViewSet in versions.VERSION_2_2_0.viewsets_removed
+    # the plans of the serializers which the viewsets use are built, but abstract serializers are
+    # left alone
+    for version in versions.VERSIONS:
+        assert (ConcreteThingSerializer, version) in _plans
+        assert (ThingViewSet.serializer_class, version) in _plans
+        assert (AbstractThingSerializer, version) not in _plans
+
+
+def test_freeze_rejects_versions_not_in_version_list(monkeypatch):
+    class Unknown(Transform):
+        version = Version("6.6.6")
+
+    only_subclasses(monkeypatch, Unknown)
+    with pytest.raises(VersionNotInVersionListError) as exc_info:
+        registry.freeze()
+    assert str(exc_info.value) == (
+        "test_freeze_rejects_versions_not_in_version_list.<locals>.Unknown uses version 6.6.6, "
+        "which is not in the VERSION_LIST"
+    )
+
+
+def test_freeze_moves_registrations_to_canonical_versions(monkeypatch):
+    monkeypatch.setattr(versions.VERSION_2_0_0, "transforms", versions.VERSION_2_0_0.transforms)
+    equal_version = Version("2.0.0")
+
+    class Stray(Transform):
+        description = "Stray"
+        version = equal_version
+
+    assert equal_version.transforms == [Stray]
+    assert Stray not in versions.VERSION_2_0_0.transforms
+    only_subclasses(monkeypatch, Stray)
+    monkeypatch.setattr(changelog, "_changelog", None)  # restore the changelog afterwards
+    registry.freeze()
+    assert Stray.version is versions.VERSION_2_0_0
+    assert versions.VERSION_2_0_0.transforms[-1] is Stray
+    assert isinstance(versions.VERSION_2_0_0.transforms, tuple)
+    assert equal_version.transforms == versions.VERSION_2_0_0.transforms
+
+
+def test_late_registration(monkeypatch):
+    monkeypatch.setattr(versions.VERSION_2_3_0, "transforms", versions.VERSION_2_3_0.transforms)
+    registered = versions.VERSION_2_3_0.transforms
+
+    class Late(Transform):
+        version = versions.VERSION_2_3_0
+
+    assert versions.VERSION_2_3_0.transforms == (*registered, Late)
+
+
+def test_check_registered_versions(monkeypatch):
+    class Unknown(Transform):
+        version = Version("6.6.6")
+
+    only_subclasses(monkeypatch, transforms.ThingTransformAddNumber, ThingViewSet, Unknown)
+    errors = registry.check_registered_versions()
+    assert [(error.obj, error.id) for error in errors] == [(Unknown, "drf_versioning.E001")]
+    assert errors[0].msg == (
+        "test_check_registered_versions.<locals>.Unknown uses version 6.6.6, which is not in the "
+        "VERSION_LIST"
+    )
+
+
+def test_check_runs_with_the_system_checks(monkeypatch):
+    class Unknown(Transform):
+        version = Version("6.6.6")
+
+    only_subclasses(monkeypatch, Unknown)
+    errors = checks.run_checks(tags=[checks.Tags.urls])
+    assert "drf_versioning.E001" in [error.id for error in errors]
+    assert "drf_versioning.E001" not in [
+        error.id for error in checks.run_checks(tags=[checks.Tags.models])
+    ]
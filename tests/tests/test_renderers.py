@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+
+import pytest
+from rest_framework import viewsets
+
+from drf_versioning.renderers import CSVRenderer, NDJSONRenderer
+from drf_versioning.views import StreamingListModelMixin, VersionedViewSet
+from tests import versions
+from tests.models import Thing
+from tests.serializers import ThingSerializer
+from tests.tests.mocks import call_viewset
+
+pytestmark = pytest.mark.django_db
+
+
+class ExportThingViewSet(StreamingListModelMixin, VersionedViewSet, viewsets.ReadOnlyModelViewSet):
+    serializer_class = ThingSerializer
+    queryset = Thing.objects.order_by("id")
+    introduced_in = versions.VERSION_1_0_0
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    stream_chunk_size = 2
+
+
+def get(media_type, version, **kwargs):
+    return call_viewset(ExportThingViewSet, version, media_type=media_type, **kwargs)
+
+
+@pytest.fixture
+def things():
+    for ii in range(3):
+        Thing.objects.create(id=ii, name=f"thing {ii}", number=ii)
+
+
+@pytest.mark.parametrize(
+    "version, expected_keys",
+    [
+        ("2.0.0", ["id", "name"]),
+        ("2.1.0", ["id", "name", "number"]),
+        ("2.2.0", ["id", "name", "number", "status", "date_updated"]),
+    ],
+)
+def test_ndjson_export(things, version, expected_keys):
+    response = get("application/x-ndjson", version)
+    assert response.streaming
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["id"] for row in rows] == [0, 1, 2]
+    assert all(list(row) == expected_keys for row in rows)
+
+
+@pytest.mark.parametrize(
+    "version, expected_header",
+    [
+        ("2.0.0", ["id", "name"]),
+        ("2.1.0", ["id", "name", "number"]),
+        ("2.2.0", ["id", "name", "number", "status", "date_updated"]),
+    ],
+)
+def test_csv_export(things, version, expected_header):
+    response = get("text/csv", version)
+    assert response.streaming
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+    content = b"".join(response.streaming_content).decode()
+    rows = list(csv.reader(io.StringIO(content)))
+    assert rows[0] == expected_header
+    assert [row[:2] for row in rows[1:]] == [["0", "thing 0"], ["1", "thing 1"], ["2", "thing 2"]]
+
+
+def test_csv_export_empty_still_has_header():
+    response = get("text/csv", "2.1.0")
+    assert b"".join(response.streaming_content) == b"id,name,number\r\n"
+
+
+def test_csv_retrieve(things):
+    response = get("text/csv", "2.1.0", action="retrieve", pk=1)
+    assert response.content == b"id,name,number\r\n1,thing 1,1\r\n"
+
+
+def test_csv_error(things):
+    response = get("text/csv", "2.1.0", action="retrieve", pk=666)
+    assert response.status_code == 404
+    assert response.content.startswith(b"detail\r\n")
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ([], b""),
+        ([{"a": 1}, {"a": 2}], b'{"a":1}\n{"a":2}\n'),
+        ({"count": 1, "results": [{"a": 1}]}, b'{"a":1}\n'),
+        ({"a": 1}, b'{"a":1}\n'),
+    ],
+)
+def test_ndjson_renderer(data, expected):
+    assert NDJSONRenderer().render(data) == expected
+
+
+def test_csv_renderer_nested_values():
+    data = [{"a": 1, "b": {"c": [1, 2]}, "d": None}]
+    assert CSVRenderer().render(data) == b'a,b,d\r\n1,"{""c"": [1, 2]}",\r\n'
@@ -0,0 +1,100 @@
+import pytest
+from django.urls import resolve, Resolver404
+from mixer.backend.django import mixer
+from rest_framework.test import APIClient
+
+from drf_versioning.middleware import URLPathVersioning
+from drf_versioning.routers import VersionedRouter
+from drf_versioning.views import VersionedViewSet
+from tests import versions, views
+from tests.models import Thing
+
+pytestmark = [pytest.mark.django_db, pytest.mark.urls("tests.tests.test_routers")]
+
+
+class PathThingViewSet(views.ThingViewSet):
+    versioning_class = URLPathVersioning
+
+
+class PathUnversionedThingViewSet(views.UnversionedThingViewSet):
+    versioning_class = URLPathVersioning
+
+
+router = VersionedRouter()
+router.register("thing", PathThingViewSet, basename="thing")
+router.register("thing4", PathUnversionedThingViewSet, basename="thing4")
+urlpatterns = router.urls
+
+
+@pytest.mark.parametrize(
+    "request_method, url, expected_status_code",
+    [
+        ("get", "/1.0.0/thing/", 404),  # list action not yet introduced
+        ("post", "/1.0.0/thing/", 201),
+        ("get", "/2.0.0/thing/", 200),
+        ("get", "/2.1.0/thing/", 200),
+        ("get", "/2.2.0/thing/", 404),  # viewset removed in v2.2.0
+        ("get", "/1.0.0/thing/666/", 200),
+        ("get", "/2.1.0/thing/666/", 404),  # retrieve action removed in v2.1.0
+        ("patch", "/2.1.0/thing/666/", 200),
+        ("get", "/2.0.0/thing/666/get_name/", 404),
+        ("get", "/2.1.0/thing/666/get_name/", 200),  # get_name introduced in v2.1.0
+        ("get", "/1.0.0/thing4/666/", 404),  # unversioned viewset with versioned retrieve
+        ("get", "/2.0.0/thing4/666/", 200),
+        ("get", "/2.2.0/thing4/", 200),
+        ("get", "/6.6.6/thing4/", 404),  # unknown version
+    ],
+)
+def test_versioned_router(request_method, url, expected_status_code):
+    mixer.blend(Thing, id=666)
+    client = APIClient()
+    method = getattr(client, request_method)
+    response = method(url, data={"name": "foo"}, format="json")
+    assert response.status_code == expected_status_code
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/2.2.0/thing/",  # viewset removed
+        "/2.2.0/thing/666/get_name/",
+        "/2.0.0/thing/666/get_name/",  # action not introduced yet
+        "/6.6.6/thing/",  # version doesn't exist
+    ],
+)
+def test_versioned_router_rejects_unavailable_endpoints_at_resolution(url):
+    with pytest.raises(Resolver404):
+        resolve(url)
+
+
+def test_versioned_router_rejects_unavailable_methods_before_dispatch():
+    match = resolve("/1.0.0/thing/")  # POST (create) exists in 1.0.0, but GET (list) doesn't
+    assert match.kwargs == {"version": "1.0.0"}
+    assert match.func.cls is PathThingViewSet
+    assert match.func.actions == {"post": "create"}
+
+
+def test_get_urls_for_version():
+    names = {url.name for url in router.get_urls_for_version(versions.VERSION_2_1_0)}
+    assert "thing-get-name" in names
+    assert "thing-list" in names
+    names = {url.name for url in router.get_urls_for_version(versions.VERSION_2_2_0)}
+    assert "thing-list" not in names
+    assert "thing4-list" in names
+
+
+def test_get_version_window():
+    assert VersionedRouter.get_version_window(PathThingViewSet, "list") == (
+        versions.VERSION_2_0_0,
+        versions.VERSION_2_2_0,
+    )
+    assert VersionedRouter.get_version_window(PathThingViewSet, "create") == (
+        versions.VERSION_1_0_0,
+        versions.VERSION_2_2_0,
+    )
+    assert VersionedRouter.get_version_window(PathUnversionedThingViewSet, "retrieve") == (
+        versions.VERSION_2_0_0,
+        versions.VERSION_2_2_0,
+    )
+    assert VersionedRouter.get_version_window(PathUnversionedThingViewSet, "list") == (None, None)
+    assert VersionedRouter.get_version_window(VersionedViewSet, "list") == (None, None)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from unittest.mock import patch
 
 import pytest
 from dateutil.parser import parse
@@ -6,22 +7,19 @@ from django.utils import timezone
 from redbreast.testing import parametrize, testparams, assert_dicts_equal
 from rest_framework import serializers
 
-from drf_versioning.serializers import VersionedSerializer
+from drf_versioning.serializers import VersionedSerializer, VersionedListSerializer
+from drf_versioning.serializers.versioned_serializer import clear_field_maps
 from drf_versioning.transforms import AddField
 from drf_versioning.versions import Version
 from drf_versioning.versions.serializers import VersionSerializer
 from tests import versions, views, transforms
 from tests.models import Thing, Person
 from tests.serializers import ThingSerializer, PersonSerializer
+from tests.tests.mocks import MockRequest
 
 pytestmark = pytest.mark.django_db
 
 
-@dataclass
-class MockRequest:
-    version: Version
-
-
 @dataclass
 class Child:
     name: str
@@ -449,3 +447,148 @@ def test_inline_serialization2(param):
         PersonSerializer(person, context={"request": request}).data,
         param.expected_output,
     )
+
+
+def test_many_uses_versioned_list_serializer():
+    assert isinstance(ThingSerializer(many=True), VersionedListSerializer)
+    assert isinstance(ParentSerializer(many=True), VersionedListSerializer)
+    # Meta is subclassed, not modified
+    assert ThingSerializer.Meta.model is Thing
+    assert serializers.ModelSerializer.__dict__.get("Meta") is None
+
+    class CustomListSerializer(serializers.ListSerializer):
+        pass
+
+    class CustomSerializer(VersionedSerializer):
+        transforms = [AddAge]
+
+        class Meta:
+            list_serializer_class = CustomListSerializer
+
+    assert type(CustomSerializer(many=True)) is CustomListSerializer
+
+
+@parametrize(
+    param := testparams("version", "expected_data"),
+    [
+        param(
+            version=versions.VERSION_2_0_0,
+            expected_data=[dict(id=1, name="foo"), dict(id=2, name="bar")],
+        ),
+        param(
+            version=versions.VERSION_2_1_0,
+            expected_data=[dict(id=1, name="foo", number=1), dict(id=2, name="bar", number=2)],
+        ),
+    ],
+)
+def test_many_applies_transforms_once_per_page(param):
+    Thing.objects.create(id=1, name="foo", number=1)
+    Thing.objects.create(id=2, name="bar", number=2)
+    request = MockRequest(version=param.version)
+    plan = ThingSerializer().get_transform_plan(param.version)
+    patch_single = patch.object(plan, "to_representation")
+    patch_batch = patch.object(plan, "to_representation_batch", wraps=plan.to_representation_batch)
+    with patch_single as mock_single, patch_batch as mock_batch:
+        serializer = ThingSerializer(
+            Thing.objects.order_by("id"), many=True, context={"request": request}
+        )
+        data = serializer.data
+
+    assert data == param.expected_data
+    assert mock_batch.call_count == 1
+    assert mock_single.call_count == 0
+
+
+def test_many_calls_overridden_to_representation():
+    class ExtraThingSerializer(ThingSerializer):
+        def to_representation(self, instance):
+            data = super().to_representation(instance)
+            data["extra"] = 1
+            return data
+
+    Thing.objects.create(id=1, name="foo", number=1)
+    request = MockRequest(version=versions.VERSION_2_0_0)
+    single = ExtraThingSerializer(Thing.objects.get(), context={"request": request}).data
+    many = ExtraThingSerializer(Thing.objects.all(), many=True, context={"request": request}).data
+    assert single == dict(id=1, name="foo", extra=1)
+    assert many == [single]
+
+
+def test_field_maps_are_cached_per_version():
+    clear_field_maps()
+    request = MockRequest(version=versions.VERSION_2_0_0)
+    with patch.object(
+        serializers.ModelSerializer,
+        "get_fields",
+        autospec=True,
+        side_effect=serializers.ModelSerializer.get_fields,
+    ) as mock_get_fields:
+        for _ in range(3):
+            fields = ThingSerializer(context={"request": request}).fields
+        for _ in range(3):
+            ThingSerializer(context={"request": MockRequest(version=versions.VERSION_2_2_0)}).fields
+
+    # once for each version
+    assert mock_get_fields.call_count == 2
+    # fields which the transforms would remove aren't built for output-only serializers
+    assert list(fields) == ["id", "name"]
+    # but they are needed for input
+    serializer = ThingSerializer(data={}, context={"request": request})
+    assert list(serializer.fields) == ["id", "name", "number", "status", "date_updated"]
+
+
+def test_field_maps_are_cached_per_canonical_version():
+    clear_field_maps()
+    with patch.object(
+        serializers.ModelSerializer,
+        "get_fields",
+        autospec=True,
+        side_effect=serializers.ModelSerializer.get_fields,
+    ) as mock_get_fields:
+        for version in ["2.0.0", "2.0", Version("2.0.0"), versions.VERSION_2_0_0]:
+            serializer = ThingSerializer(context={"request": MockRequest(version=version)})
+            assert list(serializer.fields) == ["id", "name"]
+            assert serializer._get_transform_version() is versions.VERSION_2_0_0
+    assert mock_get_fields.call_count == 1
+
+
+def test_cached_fields_are_bound_to_each_instance():
+    request = MockRequest(version=versions.VERSION_2_0_0)
+    first = ThingSerializer(context={"request": request})
+    second = ThingSerializer(context={"request": request})
+    assert first.fields["name"] is not second.fields["name"]
+    assert first.fields["name"].parent is first
+    assert second.fields["name"].parent is second
+
+
+def test_field_map_cache_can_be_disabled():
+    class UncachedThingSerializer(ThingSerializer):
+        cache_fields = False
+
+    request = MockRequest(version=versions.VERSION_2_0_0)
+    with patch.object(
+        serializers.ModelSerializer,
+        "get_fields",
+        autospec=True,
+        side_effect=serializers.ModelSerializer.get_fields,
+    ) as mock_get_fields:
+        for _ in range(3):
+            UncachedThingSerializer(context={"request": request}).fields
+    assert mock_get_fields.call_count == 3
+
+
+@pytest.mark.parametrize("version", [Version.get_latest, lambda: str(Version.get_latest())])
+def test_latest_version_skips_transforms(version):
+    Thing.objects.create(id=1, name="foo", number=1)
+    request = MockRequest(version=version())
+    with patch.object(
+        VersionedSerializer, "get_transform_plan", side_effect=AssertionError
+    ) as mock_plan:
+        single = ThingSerializer(Thing.objects.get(), context={"request": request}).data
+        many = ThingSerializer(Thing.objects.all(), many=True, context={"request": request}).data
+        serializer = ThingSerializer(data=dict(single), context={"request": request})
+        serializer.is_valid(raise_exception=True)
+
+    assert mock_plan.call_count == 0
+    assert many == [single]
+    assert serializer.validated_data["name"] == "foo"
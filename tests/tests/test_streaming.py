@@ -0,0 +1,122 @@
+import json
+
+import pytest
+from rest_framework import viewsets
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from drf_versioning.renderers import RESULTS_PLACEHOLDER, StreamingJSONRenderer
+from drf_versioning.views import StreamingListModelMixin, VersionedViewSet
+from tests import versions
+from tests.models import Thing
+from tests.serializers import ThingSerializer
+from tests.tests.mocks import call_viewset
+
+pytestmark = pytest.mark.django_db
+
+
+class StreamingThingViewSet(
+    StreamingListModelMixin, VersionedViewSet, viewsets.ReadOnlyModelViewSet
+):
+    serializer_class = ThingSerializer
+    queryset = Thing.objects.order_by("id")
+    introduced_in = versions.VERSION_1_0_0
+    stream_chunk_size = 2
+
+
+class Pagination(PageNumberPagination):
+    page_size = 3
+
+
+def get_expected(version, paginated=False):
+    class ExpectedViewSet(viewsets.ReadOnlyModelViewSet):
+        serializer_class = ThingSerializer
+        queryset = Thing.objects.order_by("id")
+        pagination_class = Pagination if paginated else None
+
+    return call_viewset(ExpectedViewSet, version).content
+
+
+@pytest.fixture
+def things():
+    for ii in range(5):
+        Thing.objects.create(id=ii, name=f"thing {ii}", number=ii)
+
+
+@pytest.mark.parametrize("version", ["1.0.0", "2.0.0", "2.1.0", "2.2.0"])
+def test_streamed_list_matches_list(things, version):
+    response = call_viewset(StreamingThingViewSet, version)
+    assert response.streaming
+    assert response["Content-Type"] == "application/json"
+    content = b"".join(response.streaming_content)
+    assert content == get_expected(version)
+    assert len(json.loads(content)) == 5
+
+
+def test_streamed_list_is_rendered_in_chunks(things):
+    response = call_viewset(StreamingThingViewSet, "2.1.0")
+    chunks = list(response.streaming_content)
+    # opening bracket, 3 chunks of 2, 2, and 1 objects, and closing bracket
+    assert len(chunks) == 5
+
+
+def test_streamed_list_empty():
+    response = call_viewset(StreamingThingViewSet, "2.1.0")
+    assert b"".join(response.streaming_content) == b"[]"
+
+
+def test_streamed_list_with_pagination(things):
+    class PaginatedViewSet(StreamingThingViewSet):
+        pagination_class = Pagination
+
+    response = call_viewset(PaginatedViewSet, "2.1.0")
+    content = b"".join(response.streaming_content)
+    assert content == get_expected("2.1.0", paginated=True)
+    data = json.loads(content)
+    assert data["count"] == 5
+    assert len(data["results"]) == 3
+
+
+def test_other_renderers_are_not_streamed(things):
+    class BrowsableViewSet(StreamingThingViewSet):
+        renderer_classes = [BrowsableAPIRenderer, JSONRenderer]
+
+    factory = APIRequestFactory()
+    request = factory.get("", HTTP_ACCEPT="text/html; version=2.1.0")
+    response = BrowsableViewSet.as_view(actions={"get": "list"})(request)
+    assert not response.streaming
+    assert len(response.data) == 5
+
+
+def test_streaming_json_renderer():
+    renderer = StreamingJSONRenderer()
+    chunks = [[{"a": 1}, {"a": 2}], [{"a": 3}]]
+    streamed = b"".join(renderer.render_stream(chunks))
+    assert streamed == renderer.render([{"a": 1}, {"a": 2}, {"a": 3}])
+
+    envelope = {"count": 3, "results": "__drf_versioning_results__", "next": None}
+    streamed = b"".join(renderer.render_stream(chunks, envelope))
+    assert json.loads(streamed) == {
+        "count": 3,
+        "results": [{"a": 1}, {"a": 2}, {"a": 3}],
+        "next": None,
+    }
+
+
+@pytest.mark.parametrize("compact", [True, False])
+@pytest.mark.parametrize("indent", [None, 2, 4])
+@pytest.mark.parametrize(
+    "chunks", [[], [[]], [[{"a": 1}, {"a": [1, 2]}], [], [{"a": {"b": "c"}}]], [[1], [2, 3]]]
+)
+def test_streaming_json_renderer_is_byte_for_byte(chunks, indent, compact, monkeypatch):
+    renderer = StreamingJSONRenderer()
+    monkeypatch.setattr(renderer, "compact", compact)
+    media_type = "application/json" if indent is None else f"application/json; indent={indent}"
+    items = [item for chunk in chunks for item in chunk]
+    streamed = b"".join(renderer.render_stream(chunks, accepted_media_type=media_type))
+    assert streamed == renderer.render(items, media_type)
+
+    envelope = {"count": 3, "results": RESULTS_PLACEHOLDER, "next": None}
+    streamed = b"".join(renderer.render_stream(chunks, envelope, media_type))
+    assert streamed == renderer.render({**envelope, "results": items}, media_type)
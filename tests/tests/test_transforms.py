@@ -1,6 +1,6 @@
 import pytest
 
-from drf_versioning.transforms import AddField, RemoveField, Transform
+from drf_versioning.transforms import AddField, RemoveField, RenameField, Transform
 from drf_versioning.versions import Version
 
 
@@ -67,6 +67,22 @@ def test_removefield_to_representation(outgoing_data, expected_result):
     assert trans.to_representation(data=outgoing_data, request=..., instance=...) == expected_result
 
 
+@pytest.mark.parametrize(
+    "new_data, old_data",
+    [
+        ({}, {}),
+        ({"new": 1}, {"old": 1}),
+        ({"new": 1, "other": 2}, {"other": 2, "old": 1}),
+    ],
+)
+def test_renamefield(new_data, old_data):
+    trans = RenameField()
+    trans.old_field_name = "old"
+    trans.new_field_name = "new"
+    assert trans.to_representation(data=dict(new_data), request=..., instance=...) == old_data
+    assert trans.to_internal_value(data=dict(old_data), request=...) == new_data
+
+
 def test_transform_meta():
     v420 = Version("4.20")
 
@@ -79,3 +95,36 @@ def test_transform_meta():
         version = v420
 
     assert SubclassOfAddField in v420.transforms
+
+
+def test_transform_to_representation_batch_defaults_to_per_item_calls():
+    calls = []
+
+    class RecordingTransform(Transform):
+        def to_representation(self, data, request, instance):
+            calls.append((data, instance))
+            data["seen"] = True
+            return data
+
+    data = [{}, {}]
+    RecordingTransform().to_representation_batch(data, request=..., instances=["a", "b"])
+    assert calls == [(data[0], "a"), (data[1], "b")]
+    assert data == [{"seen": True}, {"seen": True}]
+
+
+def test_addfield_and_removefield_to_representation_batch():
+    add = AddField()
+    add.field_name = "foo"
+    data = [{"foo": 1, "bar": 2}, {"bar": 3}]
+    assert add.to_representation_batch(data, request=..., instances=[..., ...]) == [
+        {"bar": 2},
+        {"bar": 3},
+    ]
+
+    remove = RemoveField()
+    remove.field_name = "foo"
+    remove.null_value = 0
+    assert remove.to_representation_batch(data, request=..., instances=[..., ...]) == [
+        {"bar": 2, "foo": 0},
+        {"bar": 3, "foo": 0},
+    ]
@@ -10,6 +10,7 @@ from drf_versioning.versions import Version
 from tests import versions
 from packaging.version import Version as PackagingVersion
 from tests.versions import Version as CustomVersionModel
+from tests.tests.mocks import MOCK_VERSION_LIST
 
 
 def test_version_list_retrieves_from_settings():
@@ -118,3 +119,55 @@ def test_parse(input, expected_result):
             Version.parse(input)
     else:
         assert Version.parse(input) == expected_result
+
+
+def test_versions_are_hashable():
+    assert hash(Version("2.0")) == hash(Version("2.0.0"))
+    assert {Version("2.0"): "foo"}[Version("2.0.0")] == "foo"
+
+
+@pytest.mark.parametrize("input", ["2.0.0", "2.0", "2", Version("2.0.0"), versions.VERSION_2_0_0])
+def test_get_returns_canonical_instance(input):
+    assert Version.get(input) is versions.VERSION_2_0_0
+    assert Version.get(input) is versions.VERSION_2_0_0  # cached lookup
+
+
+def test_registry_is_rebuilt_when_version_list_changes(patch_settings):
+    registry = Version.registry()
+    assert Version.registry() is registry
+    assert registry.latest is versions.VERSION_2_3_0
+    assert registry.earliest is versions.VERSION_0_0_1
+
+    with patch_settings(VERSION_LIST="tests.tests.mocks.MOCK_VERSION_LIST"):
+        assert Version.registry() is not registry
+        assert Version.get("6.9.0") is MOCK_VERSION_LIST[1]
+        with pytest.raises(VersionDoesNotExist):
+            Version.get("2.0.0")
+
+
+def test_registry_assigns_ordinals_in_version_order():
+    registry = Version.registry()
+    assert [v._ordinal for v in registry.ordered] == list(range(len(versions.VERSIONS)))
+    assert versions.VERSION_0_0_1._ordinal < versions.VERSION_2_3_0._ordinal
+    assert versions.VERSION_2_0_0._registry is registry
+
+
+@pytest.mark.parametrize(
+    "v_left, v_right, op, expected_output",
+    [
+        (versions.VERSION_1_0_0, versions.VERSION_2_0_0, operator.lt, True),
+        (versions.VERSION_2_0_0, versions.VERSION_2_0_0, operator.le, True),
+        (versions.VERSION_2_1_0, versions.VERSION_2_0_0, operator.gt, True),
+        (versions.VERSION_2_1_0, versions.VERSION_2_2_0, operator.ge, False),
+        (versions.VERSION_2_1_0, versions.VERSION_2_1_0, operator.eq, True),
+        # registered vs unregistered versions fall back to comparing the full version
+        (versions.VERSION_2_1_0, Version("2.1"), operator.eq, True),
+        (versions.VERSION_2_1_0, Version("2.0.5"), operator.gt, True),
+        (Version("2.0.5"), versions.VERSION_2_1_0, operator.lt, True),
+    ],
+)
+def test_comparison_with_registered_versions(v_left, v_right, op, expected_output):
+    Version.registry()
+    assert op(v_left, v_right) == expected_output
+    assert op(v_left, str(v_right)) == expected_output
+    assert op(str(v_left), v_right) == expected_output
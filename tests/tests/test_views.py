@@ -6,7 +6,9 @@ from drf_versioning.exceptions import VersionsNotDeclaredError
 from drf_versioning.versions import Version
 from drf_versioning.versions.views import VersionViewSet
 from drf_versioning.views import VersionedViewSet
+from tests import versions
 from tests.models import Thing
+from tests.views import ThingViewSet
 
 pytestmark = pytest.mark.django_db
 
@@ -193,3 +195,30 @@ def test_versioned_viewset_meta_enforces_versions():
         class BadViewSet2(VersionedViewSet):
             introduced_in = None
             removed_in = None
+
+
+def test_unknown_request_version_is_rejected():
+    client = APIClient()
+    response = client.get("/thing2/", HTTP_ACCEPT="application/json; version=6.6.6")
+    assert response.status_code == 406
+
+
+def test_versioned_viewset_meta_precomputes_version_windows():
+    assert ThingViewSet.version_window == (versions.VERSION_1_0_0, versions.VERSION_2_2_0)
+    assert ThingViewSet.version_windows == {
+        "list": (versions.VERSION_2_0_0, versions.VERSION_2_2_0),
+        "retrieve": (versions.VERSION_1_0_0, versions.VERSION_2_1_0),
+        "get_name": (versions.VERSION_2_1_0, versions.VERSION_2_2_0),
+    }
+
+
+def test_dispatch_does_not_register_views_per_request():
+    mixer.blend(Thing, id=666)
+    introduced = list(versions.VERSION_1_0_0.view_methods_introduced)
+    removed = list(versions.VERSION_2_2_0.view_methods_removed)
+    client = APIClient()
+    for _ in range(3):
+        response = client.get("/thing/666/", HTTP_ACCEPT="application/json; version=1.0.0")
+        assert response.status_code == 200
+    assert list(versions.VERSION_1_0_0.view_methods_introduced) == introduced
+    assert list(versions.VERSION_2_2_0.view_methods_removed) == removed